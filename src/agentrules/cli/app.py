@@ -12,7 +12,6 @@ from .commands.execplan_registry import register as register_execplan_registry
 from .commands.keys import register as register_keys
 from .commands.scaffold import register as register_scaffold
 from .commands.tree import register as register_tree
-from .ui.main_menu import run_main_menu
 
 
 def build_app() -> typer.Typer:
@@ -54,6 +53,8 @@ def build_app() -> typer.Typer:
         if ctx.invoked_subcommand is not None:
             return
 
+        from .ui.main_menu import run_main_menu
+
         run_main_menu(context)
 
     return app
@@ -2,9 +2,8 @@
 
 from __future__ import annotations
 
-from pathlib import Path
+from functools import cache
 
-from dotenv import load_dotenv
 from rich.console import Console
 
 from agentrules.core.configuration import get_config_manager, model_presets
@@ -15,10 +14,10 @@ from .context import CliContext
 CONFIG_MANAGER = get_config_manager()
 
 
-def _load_env_files() -> None:
-    env_path = Path(".env")
-    if env_path.exists():
-        load_dotenv(env_path)
+@cache
+def _shared_console() -> Console:
+    # Rich resolves sys.stdout at write time, so one console can serve every command.
+    return Console()
 
 
 def bootstrap_runtime() -> CliContext:
@@ -30,5 +29,4 @@ def bootstrap_runtime() -> CliContext:
     CONFIG_MANAGER.apply_config_to_environment()
     model_presets.apply_user_overrides()
 
-    console = Console()
-    return CliContext(console=console)
+    return CliContext(console=_shared_console())
@@ -7,16 +7,24 @@ from pathlib import Path
 import typer
 
 from ..bootstrap import bootstrap_runtime
-from ..services.pipeline_runner import run_pipeline
+from ..context import CliContext
 
-DEFAULT_ANALYZE_PATH = Path.cwd()
 PATH_ARGUMENT = typer.Argument(
-    DEFAULT_ANALYZE_PATH,
+    None,
+    help="Project directory to analyze (defaults to the current directory).",
+    show_default=False,
     exists=True,
     dir_okay=True,
     file_okay=False,
     resolve_path=True,
 )
+CACHE_DIR_OPTION = typer.Option(
+    None,
+    "--cache-dir",
+    file_okay=False,
+    resolve_path=True,
+    help="Reuse provider responses cached in this directory for identical requests.",
+)
 
 
 def _normalize_rules_filename_override(value: str | None) -> str | None:
@@ -31,23 +39,46 @@ def _normalize_rules_filename_override(value: str | None) -> str | None:
     return normalized
 
 
+def run_pipeline(
+    path: Path,
+    offline: bool,
+    context: CliContext,
+    *,
+    rules_filename_override: str | None = None,
+    response_cache_dir: Path | None = None,
+) -> None:
+    """Run the analysis pipeline, importing the provider stack only when needed."""
+
+    from ..services.pipeline_runner import run_pipeline as _run_pipeline
+
+    _run_pipeline(
+        path,
+        offline,
+        context,
+        rules_filename_override=rules_filename_override,
+        response_cache_dir=response_cache_dir,
+    )
+
+
 def register(app: typer.Typer) -> None:
     """Register the `analyze` subcommand with the provided Typer app."""
 
     @app.command()
     def analyze(  # type: ignore[func-returns-value]
-        path: Path = PATH_ARGUMENT,
+        path: Path | None = PATH_ARGUMENT,
         offline: bool = typer.Option(False, "--offline", help="Run using offline dummy architects (no API calls)."),
         rules_filename: str | None = typer.Option(
             None,
             "--rules-filename",
             help="Override the output rules filename for this run (for example CLAUDE.md).",
         ),
+        cache_dir: Path | None = CACHE_DIR_OPTION,
     ) -> None:
         context = bootstrap_runtime()
         run_pipeline(
-            path,
+            path or Path.cwd(),
             offline,
             context,
             rules_filename_override=_normalize_rules_filename_override(rules_filename),
+            response_cache_dir=cache_dir,
         )
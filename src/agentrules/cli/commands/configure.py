@@ -2,19 +2,12 @@
 
 from __future__ import annotations
 
-import questionary
 import typer
 
 from agentrules.core.configuration import PROVIDER_ENV_MAP
 
 from ..bootstrap import bootstrap_runtime
 from ..services import configuration as config_service
-from ..ui.settings import (
-    configure_logging,
-    configure_models,
-    configure_output_preferences,
-    configure_settings,
-)
 
 
 def register(app: typer.Typer) -> None:
@@ -44,6 +37,17 @@ def register(app: typer.Typer) -> None:
             help="Configure output generation preferences.",
         ),
     ) -> None:
+        # Questionary and the settings flows are only needed once a command actually runs.
+        import questionary
+
+        from ..ui.settings import (
+            configure_logging,
+            configure_models,
+            configure_output_preferences,
+            configure_settings,
+        )
+        from ..ui.styles import CLI_STYLE
+
         context = bootstrap_runtime()
 
         option_count = sum(
@@ -77,7 +81,11 @@ def register(app: typer.Typer) -> None:
                     f"Unknown provider '{provider}'. Options: {', '.join(PROVIDER_ENV_MAP.keys())}"
                 )
 
-            answer = questionary.password(f"{provider.title()} API key:", qmark="🔐").ask()
+            answer = questionary.password(
+                f"{provider.title()} API key:",
+                qmark="🔐",
+                style=CLI_STYLE,
+            ).ask()
             if answer is None:
                 context.console.print("[yellow]No changes made.[/]")
                 return
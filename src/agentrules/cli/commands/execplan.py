@@ -16,12 +16,14 @@ from agentrules.core.execplan.milestones import (
 from agentrules.core.execplan.registry import (
     DEFAULT_EXECPLANS_DIR,
     DEFAULT_REGISTRY_PATH,
+    RegistryBuildResult,
     collect_execplan_registry,
+    count_active_execplans,
     list_active_execplan_summaries,
-    summarize_registry_activity,
 )
 
 from ..bootstrap import bootstrap_runtime
+from .execplan_registry import _print_issues
 
 TITLE_ARGUMENT = typer.Argument(..., help="Human-readable ExecPlan title.")
 EXECPLAN_ID_ARGUMENT = typer.Argument(..., help="Canonical ExecPlan ID (EP-YYYYMMDD-NNN).")
@@ -114,11 +116,40 @@ MILESTONE_REMAINING_INCLUDE_PATH_OPTION = typer.Option(
     help="Include milestone file path in remaining output.",
 )
 
+_MILESTONE_LOCATION_LABELS = {"active": "[green]active[/]", "archived": "[yellow]archived[/]"}
+
 
 def _resolve_path(root: Path, value: Path) -> Path:
     return value.resolve() if value.is_absolute() else (root / value).resolve()
 
 
+def _emit_registry_result(
+    registry_result: RegistryBuildResult,
+    *,
+    console,
+    fail_on_registry_warn: bool,
+) -> int:
+    """Report a post-command registry refresh and return the command exit code."""
+
+    _print_issues(registry_result, console=console)
+
+    if registry_result.wrote_registry and registry_result.output_path is not None:
+        console.print(f"[green]Updated registry:[/] {registry_result.output_path.as_posix()}")
+        return 0
+
+    counts = f"errors={registry_result.error_count}, warnings={registry_result.warning_count}"
+    if registry_result.error_count > 0:
+        console.print(f"[red]Registry update failed.[/] {counts}")
+        return 1
+
+    if fail_on_registry_warn and registry_result.warning_count > 0:
+        console.print(f"[yellow]Registry not written due to warnings.[/] {counts}")
+        return 1
+
+    console.print("[yellow]Registry was not updated.[/]")
+    return 1
+
+
 def _count_active_execplans(
     *,
     root: Path,
@@ -128,12 +159,11 @@ def _count_active_execplans(
     if registry is None:
         collected = collect_execplan_registry(root=root, execplans_dir=execplans_dir)
         registry = collected.registry
-    summary = summarize_registry_activity(
+    return count_active_execplans(
         registry=registry,
         root=root,
         execplans_dir=execplans_dir,
     )
-    return summary.active_execplans
 
 
 def _format_milestone_progress(*, active_milestones: int, total_milestones: int) -> str:
@@ -204,34 +234,13 @@ def register(app: typer.Typer) -> None:
         registry_result = result.registry_result
         if not update_registry or registry_result is None:
             raise typer.Exit(0)
-
-        for issue in registry_result.issues:
-            prefix = "[yellow]WARNING[/]" if issue.severity == "warning" else "[red]ERROR[/]"
-            if issue.path:
-                console.print(f"{prefix} {issue.path}: {issue.message}")
-            else:
-                console.print(f"{prefix} {issue.message}")
-
-        if registry_result.wrote_registry and registry_result.output_path is not None:
-            console.print(f"[green]Updated registry:[/] {registry_result.output_path.as_posix()}")
-            raise typer.Exit(0)
-
-        if registry_result.error_count > 0:
-            console.print(
-                "[red]Registry update failed.[/] "
-                f"errors={registry_result.error_count}, warnings={registry_result.warning_count}"
-            )
-            raise typer.Exit(1)
-
-        if fail_on_registry_warn and registry_result.warning_count > 0:
-            console.print(
-                "[yellow]Registry not written due to warnings.[/] "
-                f"errors={registry_result.error_count}, warnings={registry_result.warning_count}"
+        raise typer.Exit(
+            _emit_registry_result(
+                registry_result,
+                console=console,
+                fail_on_registry_warn=fail_on_registry_warn,
             )
-            raise typer.Exit(1)
-
-        console.print("[yellow]Registry was not updated.[/]")
-        raise typer.Exit(1)
+        )
 
     @execplan_app.command("archive")
     def archive_existing_execplan(  # type: ignore[func-returns-value]
@@ -287,34 +296,13 @@ def register(app: typer.Typer) -> None:
         registry_result = result.registry_result
         if not update_registry or registry_result is None:
             raise typer.Exit(0)
-
-        for issue in registry_result.issues:
-            prefix = "[yellow]WARNING[/]" if issue.severity == "warning" else "[red]ERROR[/]"
-            if issue.path:
-                console.print(f"{prefix} {issue.path}: {issue.message}")
-            else:
-                console.print(f"{prefix} {issue.message}")
-
-        if registry_result.wrote_registry and registry_result.output_path is not None:
-            console.print(f"[green]Updated registry:[/] {registry_result.output_path.as_posix()}")
-            raise typer.Exit(0)
-
-        if registry_result.error_count > 0:
-            console.print(
-                "[red]Registry update failed.[/] "
-                f"errors={registry_result.error_count}, warnings={registry_result.warning_count}"
-            )
-            raise typer.Exit(1)
-
-        if fail_on_registry_warn and registry_result.warning_count > 0:
-            console.print(
-                "[yellow]Registry not written due to warnings.[/] "
-                f"errors={registry_result.error_count}, warnings={registry_result.warning_count}"
+        raise typer.Exit(
+            _emit_registry_result(
+                registry_result,
+                console=console,
+                fail_on_registry_warn=fail_on_registry_warn,
             )
-            raise typer.Exit(1)
-
-        console.print("[yellow]Registry was not updated.[/]")
-        raise typer.Exit(1)
+        )
 
     @execplan_app.command("list")
     def list_execplans(  # type: ignore[func-returns-value]
@@ -358,15 +346,12 @@ def register(app: typer.Typer) -> None:
             console.print("[yellow]No active ExecPlans found.[/]")
             raise typer.Exit(0)
 
-        total_milestones = sum(summary.total_milestones for summary in summaries)
-        active_milestones = sum(summary.active_milestones for summary in summaries)
-        overall_progress = _format_milestone_progress(
-            active_milestones=active_milestones,
-            total_milestones=total_milestones,
-        )
-        console.print(f"[green]Active ExecPlans:[/] {len(summaries)} ({overall_progress})")
-
+        total_milestones = 0
+        active_milestones = 0
+        lines: list[str] = []
         for summary in summaries:
+            total_milestones += summary.total_milestones
+            active_milestones += summary.active_milestones
             per_plan_progress = _format_milestone_progress(
                 active_milestones=summary.active_milestones,
                 total_milestones=summary.total_milestones,
@@ -377,7 +362,14 @@ def register(app: typer.Typer) -> None:
             )
             if include_path:
                 line += f" -> {summary.path}"
-            console.print(line, markup=False, soft_wrap=True)
+            lines.append(line)
+
+        overall_progress = _format_milestone_progress(
+            active_milestones=active_milestones,
+            total_milestones=total_milestones,
+        )
+        console.print(f"[green]Active ExecPlans:[/] {len(summaries)} ({overall_progress})")
+        console.print("\n".join(lines), markup=False, soft_wrap=True)
         raise typer.Exit(0)
 
     @milestone_app.command("new")
@@ -429,13 +421,14 @@ def register(app: typer.Typer) -> None:
         context = bootstrap_runtime()
         console = context.console
 
+        normalized_execplan_id = execplan_id.strip()
         resolved_root = (root or Path.cwd()).resolve()
         resolved_execplans_dir = _resolve_path(resolved_root, execplans_dir)
 
         try:
             milestones = list_execplan_milestones(
                 root=resolved_root,
-                execplan_id=execplan_id.strip(),
+                execplan_id=normalized_execplan_id,
                 execplans_dir=resolved_execplans_dir,
                 include_archived=include_archived,
             )
@@ -443,12 +436,16 @@ def register(app: typer.Typer) -> None:
             raise typer.BadParameter(str(error)) from error
 
         if not milestones:
-            console.print(f"[yellow]No milestones found for {execplan_id.strip()}.[/]")
+            console.print(f"[yellow]No milestones found for {normalized_execplan_id}.[/]")
             raise typer.Exit(0)
 
-        for milestone in milestones:
-            status = "[green]active[/]" if milestone.location == "active" else "[yellow]archived[/]"
-            console.print(f"{status} {milestone.milestone_id} -> {milestone.path.as_posix()}")
+        console.print(
+            "\n".join(
+                f"{_MILESTONE_LOCATION_LABELS[milestone.location]} "
+                f"{milestone.milestone_id} -> {milestone.path.as_posix()}"
+                for milestone in milestones
+            )
+        )
         raise typer.Exit(0)
 
     @milestone_app.command("archive")
@@ -514,9 +511,9 @@ def register(app: typer.Typer) -> None:
             raise typer.Exit(0)
 
         console.print(f"[green]Remaining milestones for {normalized_execplan_id}:[/] {len(milestones)}")
-        for milestone in milestones:
-            if include_path:
-                console.print(f"{milestone.milestone_id} -> {milestone.path.as_posix()}")
-            else:
-                console.print(milestone.milestone_id)
+        if include_path:
+            lines = [f"{milestone.milestone_id} -> {milestone.path.as_posix()}" for milestone in milestones]
+        else:
+            lines = [milestone.milestone_id for milestone in milestones]
+        console.print("\n".join(lines), markup=False, highlight=False)
         raise typer.Exit(0)
@@ -11,6 +11,7 @@ from agentrules.core.execplan.registry import (
     DEFAULT_EXECPLANS_DIR,
     DEFAULT_REGISTRY_PATH,
     RegistryBuildResult,
+    RegistryIssue,
     build_execplan_registry,
     collect_execplan_registry,
     summarize_registry_activity,
@@ -18,18 +19,23 @@ from agentrules.core.execplan.registry import (
 
 from ..bootstrap import bootstrap_runtime
 
+_ERROR_PREFIX = "[red]ERROR[/]"
+_ISSUE_PREFIX = {"warning": "[yellow]WARNING[/]", "error": _ERROR_PREFIX}
+
 
 def _resolve_path(root: Path, value: Path) -> Path:
     return value.resolve() if value.is_absolute() else (root / value).resolve()
 
 
+def _format_issue(issue: RegistryIssue) -> str:
+    prefix = _ISSUE_PREFIX.get(issue.severity, _ERROR_PREFIX)
+    return f"{prefix} {issue.path}: {issue.message}" if issue.path else f"{prefix} {issue.message}"
+
+
 def _print_issues(result: RegistryBuildResult, *, console) -> None:
-    for issue in result.issues:
-        prefix = "[yellow]WARNING[/]" if issue.severity == "warning" else "[red]ERROR[/]"
-        if issue.path:
-            console.print(f"{prefix} {issue.path}: {issue.message}")
-        else:
-            console.print(f"{prefix} {issue.message}")
+    lines = [_format_issue(issue) for issue in result.issues]
+    if lines:
+        console.print("\n".join(lines))
 
 
 def _exit_code_for_result(result: RegistryBuildResult, *, fail_on_warn: bool) -> int:
@@ -5,7 +5,6 @@ from __future__ import annotations
 import typer
 
 from ..bootstrap import bootstrap_runtime
-from ..ui.settings import show_provider_summary
 
 
 def register(app: typer.Typer) -> None:
@@ -13,5 +12,7 @@ def register(app: typer.Typer) -> None:
 
     @app.command("keys")
     def show_keys() -> None:  # type: ignore[func-returns-value]
+        from ..ui.settings import show_provider_summary
+
         context = bootstrap_runtime()
         show_provider_summary(context)
@@ -26,6 +26,14 @@ FORCE_OPTION = typer.Option(
     help="Overwrite outdated scaffold templates and create timestamped .bak backups.",
 )
 
+# Scaffold messages lead with a status word; anything else is a create/update.
+_MESSAGE_STYLES = {"up-to-date": "dim", "missing": "yellow", "outdated": "yellow"}
+
+
+def _styled_message(message: str) -> str:
+    style = _MESSAGE_STYLES.get(message.partition(" ")[0].lower(), "green")
+    return f"[{style}]{message}[/]"
+
 
 def register(app: typer.Typer) -> None:
     """Register the `scaffold` command group."""
@@ -39,12 +47,12 @@ def register(app: typer.Typer) -> None:
         check: bool = CHECK_OPTION,
         force: bool = FORCE_OPTION,
     ) -> None:
-        context = bootstrap_runtime()
-        console = context.console
-
         if check and force:
             raise typer.BadParameter("Choose either --check or --force, not both.")
 
+        context = bootstrap_runtime()
+        console = context.console
+
         target_directory = (root or Path.cwd()).resolve()
 
         try:
@@ -57,15 +65,8 @@ def register(app: typer.Typer) -> None:
             console.print(f"[red]Scaffold sync failed: {error}[/]")
             raise typer.Exit(2) from error
 
-        for message in result.messages:
-            normalized = message.lower()
-            if normalized.startswith("up-to-date"):
-                style = "dim"
-            elif normalized.startswith("missing") or normalized.startswith("outdated"):
-                style = "yellow"
-            else:
-                style = "green"
-            console.print(f"[{style}]{message}[/]")
+        if result.messages:
+            console.print("\n".join(_styled_message(message) for message in result.messages))
 
         if check:
             if result.ok:
@@ -13,6 +13,7 @@ from agentrules.core.configuration import (
 )
 
 CONFIG_MANAGER = get_config_manager()
+_PROVIDER_ITEMS: tuple[tuple[str, str], ...] = tuple(PROVIDER_ENV_MAP.items())
 
 
 @dataclass(frozen=True)
@@ -28,7 +29,7 @@ def list_provider_states() -> list[ProviderState]:
     keys = CONFIG_MANAGER.get_current_provider_keys()
     return [
         ProviderState(name=provider, env_var=env_var, api_key=keys.get(provider))
-        for provider, env_var in PROVIDER_ENV_MAP.items()
+        for provider, env_var in _PROVIDER_ITEMS
     ]
 
 
@@ -4,12 +4,16 @@ from __future__ import annotations
 
 import asyncio
 import os
+import sys
 import time
+from collections.abc import Callable, Coroutine
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 
 from agentrules.cli.ui.analysis_view import AnalysisView
 from agentrules.cli.ui.event_sink import ViewEventSink
+from agentrules.core.agents.cache import RESPONSE_CACHE_ENV_VAR
 from agentrules.core.configuration import get_config_manager
 from agentrules.core.pipeline import (
     EffectiveExclusions,
@@ -24,6 +28,45 @@ from agentrules.core.pipeline import (
 
 from ..context import CliContext
 
+try:
+    import uvloop  # type: ignore
+except ImportError:  # pragma: no cover - optional accelerator.
+    uvloop = None
+
+
+def _event_loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Return the uvloop loop factory when available, otherwise the asyncio default."""
+
+    if uvloop is None or sys.platform == "win32":
+        return None
+    return uvloop.new_event_loop
+
+
+T = TypeVar("T")
+
+
+def _run_until_complete(coro_factory: Callable[[], Coroutine[Any, Any, T]]) -> T:
+    """
+    Drive the coroutine to completion on a fresh loop built by ``_event_loop_factory``.
+
+    When the caller already runs an event loop in this thread (e.g. a notebook), the
+    coroutine is driven on its own loop in a worker thread instead.
+    """
+
+    loop_factory = _event_loop_factory()
+
+    def _run() -> T:
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            return runner.run(coro_factory())
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return _run()
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(_run).result()
+
 
 def _activate_offline_mode(context: CliContext) -> None:
     if os.getenv("OFFLINE", "0") != "1":
@@ -44,11 +87,14 @@ def run_pipeline(
     context: CliContext,
     *,
     rules_filename_override: str | None = None,
+    response_cache_dir: Path | None = None,
 ) -> None:
     """Execute the analysis pipeline for the given path."""
 
     if offline:
         os.environ["OFFLINE"] = "1"
+    if response_cache_dir is not None:
+        os.environ[RESPONSE_CACHE_ENV_VAR] = str(response_cache_dir)
 
     _activate_offline_mode(context)
 
@@ -188,14 +234,7 @@ def run_pipeline(
             metrics=metrics,
         )
 
-    try:
-        result = asyncio.run(_execute())
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        try:
-            result = loop.run_until_complete(_execute())
-        finally:
-            loop.close()
+    result = _run_until_complete(_execute)
 
     output_writer = PipelineOutputWriter()
     output_options = PipelineOutputOptions(
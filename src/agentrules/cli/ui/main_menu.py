@@ -8,41 +8,43 @@ from textwrap import dedent
 import questionary
 
 from ..context import CliContext
-from ..services.pipeline_runner import run_pipeline
 from .settings import configure_settings
 from .styles import CLI_STYLE, navigation_choice
 
+_BANNER = dedent(
+    """
+    [bold cyan]
+     █████╗  ██████╗ ███████╗███╗   ██╗████████╗██████╗ ██╗   ██╗██╗     ███████╗███████╗
+    ██╔══██╗██╔════╝ ██╔════╝████╗  ██║╚══██╔══╝██╔══██╗██║   ██║██║     ██╔════╝██╔════╝
+    ███████║██║  ███╗█████╗  ██╔██╗ ██║   ██║   ██████╔╝██║   ██║██║     █████╗  ███████╗
+    ██╔══██║██║   ██║██╔══╝  ██║╚██╗██║   ██║   ██╔══██╗██║   ██║██║     ██╔══╝  ╚════██║
+    ██║  ██║╚██████╔╝███████╗██║ ╚████║   ██║   ██║  ██║╚██████╔╝███████╗███████╗███████║
+    ╚═╝  ╚═╝ ╚═════╝ ╚══════╝╚═╝  ╚═══╝   ╚═╝   ╚═╝  ╚═╝ ╚═════╝ ╚══════╝╚══════╝╚══════╝
+    [/bold cyan]
+    """
+)
+
+_MENU_OPTIONS: tuple[tuple[str, str], ...] = (
+    ("Analyze current directory", "analyze_current"),
+    ("Analyze another path", "analyze_other"),
+    ("Settings", "settings"),
+)
+
 
 def run_main_menu(context: CliContext) -> None:
     console = context.console
-    banner = dedent(
-        """
-        [bold cyan]
-         █████╗  ██████╗ ███████╗███╗   ██╗████████╗██████╗ ██╗   ██╗██╗     ███████╗███████╗
-        ██╔══██╗██╔════╝ ██╔════╝████╗  ██║╚══██╔══╝██╔══██╗██║   ██║██║     ██╔════╝██╔════╝
-        ███████║██║  ███╗█████╗  ██╔██╗ ██║   ██║   ██████╔╝██║   ██║██║     █████╗  ███████╗
-        ██╔══██║██║   ██║██╔══╝  ██║╚██╗██║   ██║   ██╔══██╗██║   ██║██║     ██╔══╝  ╚════██║
-        ██║  ██║╚██████╔╝███████╗██║ ╚████║   ██║   ██║  ██║╚██████╔╝███████╗███████╗███████║
-        ╚═╝  ╚═╝ ╚═════╝ ╚══════╝╚═╝  ╚═══╝   ╚═╝   ╚═╝  ╚═╝ ╚═════╝ ╚══════╝╚══════╝╚══════╝
-        [/bold cyan]
-        """
-    )
-    console.print(banner)
+    console.print(_BANNER)
     console.print("[dim]Analyze projects, manage providers, and tune model presets.[/dim]\n")
 
-    menu_options = [
-        ("Analyze current directory", "analyze_current"),
-        ("Analyze another path", "analyze_other"),
-        ("Settings", "settings"),
+    from ..services.pipeline_runner import run_pipeline
+
+    choices = [
+        questionary.Choice(title=label, value=value)
+        for label, value in _MENU_OPTIONS
     ]
+    choices.append(navigation_choice("Exit", value="exit"))
 
     while True:
-        choices = [
-            questionary.Choice(title=label, value=value)
-            for label, value in menu_options
-        ]
-        choices.append(navigation_choice("Exit", value="exit"))
-
         choice = questionary.select(
             "What would you like to do?",
             choices=choices,
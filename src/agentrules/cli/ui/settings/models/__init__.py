@@ -91,7 +91,6 @@ def configure_models(context: CliContext) -> None:
         active = configuration.get_active_presets()
         overrides = {phase: key for phase, key in active.items() if phase in model_presets.PHASE_SEQUENCE and key}
         configuration.apply_model_overrides(overrides)
-        configuration.apply_model_overrides()
         console.print("[green]Model selections saved.[/]")
     else:
         console.print("[dim]No model presets changed.[/]")
@@ -104,23 +103,21 @@ def _build_phase_choices(
     offline_mode: bool,
 ) -> list[questionary.Choice | questionary.Separator]:
     phase_choices: list[questionary.Choice | questionary.Separator] = []
-    handled_phases: set[str] = set()
+    get_title = model_presets.get_phase_title
+    get_default_key = model_presets.get_default_preset_key
 
-    for phase in model_presets.PHASE_SEQUENCE:
-        if phase in handled_phases:
-            continue
-
-        if phase == "phase1" and "researcher" in model_presets.PHASE_SEQUENCE:
-            header_title = model_presets.get_phase_title("phase1")
+    for phase in model_presets.MENU_PHASE_SEQUENCE:
+        if phase == "phase1" and model_presets.RESEARCHER_GROUPED_WITH_PHASE1:
+            header_title = get_title("phase1")
             phase_choices.append(questionary.Separator(header_title))
 
-            general_key = active.get("phase1", model_presets.get_default_preset_key("phase1"))
+            general_key = active.get("phase1", get_default_key("phase1"))
             general_model, general_provider = current_labels(general_key)
             phase_choices.append(
                 model_display_choice("├─ General Agents", general_model, general_provider, value="phase1")
             )
 
-            researcher_key = active.get("researcher", model_presets.get_default_preset_key("researcher"))
+            researcher_key = active.get("researcher", get_default_key("researcher"))
             researcher_model, researcher_provider = current_labels(researcher_key)
             if not tavily_available and not offline_mode:
                 researcher_model = "Add Tavily API key to enable"
@@ -131,7 +128,7 @@ def _build_phase_choices(
                     researcher_model = status_label
                 else:
                     researcher_model = f"{researcher_model} ({status_label})"
-            researcher_title = model_presets.get_phase_title("researcher")
+            researcher_title = get_title("researcher")
             phase_choices.append(
                 model_display_choice(
                     f"└─ {researcher_title}",
@@ -140,15 +137,12 @@ def _build_phase_choices(
                     value="researcher",
                 )
             )
-
-            handled_phases.update({"phase1", "researcher"})
             continue
 
-        title = model_presets.get_phase_title(phase)
-        current_key = active.get(phase, model_presets.get_default_preset_key(phase))
+        title = get_title(phase)
+        current_key = active.get(phase, get_default_key(phase))
         model_label, provider_label = current_labels(current_key)
         phase_choices.append(model_display_choice(title, model_label, provider_label, value=phase))
-        handled_phases.add(phase)
 
     return phase_choices
 
@@ -96,6 +96,7 @@ def build_model_choice_state(
         )
 
     group_selection_map: dict[str, GroupSelection] = {}
+    group_value_by_preset: dict[str, str] = {}
     for idx, entry in enumerate(grouped_entries):
         variants = entry.variants
         if len(variants) == 1:
@@ -131,27 +132,23 @@ def build_model_choice_state(
                 )
             )
             group_selection_map[group_value] = entry
+            for variant in variants:
+                group_value_by_preset.setdefault(variant.preset_key, group_value)
 
     fallback_value = "__RESET__"
     if model_choices:
         fallback_value = cast(str, model_choices[0].value)
 
+    choice_values = {choice.value for choice in model_choices}
     default_value = fallback_value
-    if current_key and any(choice.value == current_key for choice in model_choices):
+    if current_key and current_key in choice_values:
         default_value = current_key
-    else:
-        for group_value, entry in group_selection_map.items():
-            if any(v.preset_key == current_key for v in entry.variants):
-                default_value = group_value
-                break
-        else:
-            if default_key and any(choice.value == default_key for choice in model_choices):
-                default_value = default_key
-            else:
-                for group_value, entry in group_selection_map.items():
-                    if any(v.preset_key == default_key for v in entry.variants):
-                        default_value = group_value
-                        break
+    elif current_key in group_value_by_preset:
+        default_value = group_value_by_preset[current_key]
+    elif default_key and default_key in choice_values:
+        default_value = default_key
+    elif default_key in group_value_by_preset:
+        default_value = group_value_by_preset[default_key]
 
     return ModelChoiceState(
         choices=model_choices,
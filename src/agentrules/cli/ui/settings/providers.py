@@ -45,14 +45,15 @@ def configure_provider_keys(context: CliContext) -> None:
     console.print("Select a provider to update. Leave the key blank to keep the current value.")
 
     updated = False
+    states = configuration.list_provider_states()
+    # Provider names never change while the menu is open, so the choices are built once.
+    choices: list[questionary.Choice] = [
+        questionary.Choice(title=state.name.title(), value=state.name) for state in states
+    ]
+    choices.append(navigation_choice("Done", value="__DONE__"))
 
     while True:
-        states = configuration.list_provider_states()
         _render_provider_table(context, states)
-        choices: list[questionary.Choice] = [
-            questionary.Choice(title=state.name.title(), value=state.name) for state in states
-        ]
-        choices.append(navigation_choice("Done", value="__DONE__"))
 
         selection = questionary.select(
             "Select provider to configure:",
@@ -87,6 +88,7 @@ def configure_provider_keys(context: CliContext) -> None:
         trimmed = answer.strip()
         if trimmed:
             configuration.save_provider_key(selection, trimmed)
+            states = configuration.list_provider_states()
             updated = True
             console.print(f"[green]{selection.title()} key updated.[/]")
         else:
@@ -31,6 +31,16 @@ CLI_STYLE = Style(
     ]
 )
 
+# Fixed token segments shared by the badge-style choices below.
+_SEPARATOR_TOKEN = ("class:status.separator", "  ")
+_BRACKET_OPEN_TOKEN = ("class:status.bracket", "[")
+_BRACKET_CLOSE_TOKEN = ("class:status.bracket", "]")
+_GAP_TOKEN = ("class:text", "  ")
+_TOGGLE_STATUS_TOKENS = {
+    True: ("class:status.enabled", "ON"),
+    False: ("class:status.disabled", "OFF"),
+}
+
 
 def navigation_choice(label: str, *, value: Any) -> questionary.Choice:
     """Return a dimmed navigation choice (e.g. Back, Done)."""
@@ -42,14 +52,12 @@ def navigation_choice(label: str, *, value: Any) -> questionary.Choice:
 def toggle_choice(label: str, enabled: bool, *, value: Any) -> questionary.Choice:
     """Return a choice with a color-coded ON/OFF status badge."""
 
-    status_class = "status.enabled" if enabled else "status.disabled"
-    status_text = "ON" if enabled else "OFF"
     tokens: list[tuple[str, str]] = [
         ("class:text", label),
-        ("class:status.separator", "  "),
-        ("class:status.bracket", "["),
-        (f"class:{status_class}", status_text),
-        ("class:status.bracket", "]"),
+        _SEPARATOR_TOKEN,
+        _BRACKET_OPEN_TOKEN,
+        _TOGGLE_STATUS_TOKENS[bool(enabled)],
+        _BRACKET_CLOSE_TOKEN,
     ]
     return questionary.Choice(tokens, value=value)
 
@@ -59,10 +67,10 @@ def value_choice(label: str, value_text: str, *, value: Any) -> questionary.Choi
 
     tokens: list[tuple[str, str]] = [
         ("class:text", label),
-        ("class:status.separator", "  "),
-        ("class:status.bracket", "["),
+        _SEPARATOR_TOKEN,
+        _BRACKET_OPEN_TOKEN,
         ("class:status.value", value_text),
-        ("class:status.bracket", "]"),
+        _BRACKET_CLOSE_TOKEN,
     ]
     return questionary.Choice(tokens, value=value)
 
@@ -83,7 +91,7 @@ def model_display_choice(
     tokens.extend(
         [
             ("class:status.model", model_label),
-            ("class:text", "  "),
+            _GAP_TOKEN,
             ("class:status.provider", f"[{provider_label}]")
         ]
     )
@@ -95,9 +103,9 @@ def model_variant_choice(label: str, variant: str | None, provider: str, *, valu
 
     tokens: list[tuple[str, str]] = [
         ("class:text", label),
-        ("class:status.separator", "  "),
+        _SEPARATOR_TOKEN,
         ("class:status.variant", variant or "Default"),
-        ("class:text", "  "),
+        _GAP_TOKEN,
         ("class:status.provider", f"[{provider}]")
     ]
     return questionary.Choice(tokens, value=value)
@@ -5,8 +5,11 @@ core/agent_tools/web_search/__init__.py
 from .tavily import (  # noqa: F401
     TAVILY_SEARCH_TOOL_SCHEMA as TAVILY_SEARCH_TOOL_SCHEMA,
 )
+from .tavily import (
+    close_tavily_client as close_tavily_client,
+)
 from .tavily import (
     run_tavily_search as run_tavily_search,
 )
 
-__all__ = ["TAVILY_SEARCH_TOOL_SCHEMA", "run_tavily_search"]
+__all__ = ["TAVILY_SEARCH_TOOL_SCHEMA", "close_tavily_client", "run_tavily_search"]
@@ -9,14 +9,18 @@ It includes the tool's schema definition and the function to execute the search.
 # Importing Required Libraries
 # ====================================================
 
+import asyncio
 import json
 import os
+import time
 from typing import Any, Literal, cast
 
-from tavily import AsyncTavilyClient
-
 from agentrules.core.types.tool_config import Tool
 
+# The tavily SDK pulls in a sizeable HTTP stack, so it is imported on the first
+# search rather than whenever the tool schema is loaded.
+AsyncTavilyClient: Any = None
+
 # ====================================================
 # Tool Definition
 # ====================================================
@@ -59,33 +63,102 @@ TAVILY_SEARCH_TOOL_SCHEMA: Tool = cast(Tool, {
 # Literal type for Tavily depth argument
 TavilySearchDepth = Literal["basic", "advanced"]
 
+# Successful searches are reused for an hour within the process so repeated
+# researcher queries do not cost another API call.
+_SEARCH_CACHE_TTL_SECONDS = 3600.0
+_SEARCH_CACHE: dict[tuple[str, int, str], tuple[float, str]] = {}
+# Searches currently awaiting Tavily, so concurrent duplicates share one request.
+_INFLIGHT_SEARCHES: dict[tuple[str, int, str], asyncio.Future[str]] = {}
+# One client (and connection pool) per API key and event loop; see _shared_client.
+_SHARED_CLIENT: tuple[str, asyncio.AbstractEventLoop, Any] | None = None
+
 
 def _normalize_search_depth(raw_depth: Any) -> TavilySearchDepth:
     """
     Coerce arbitrary input into a valid Tavily search depth literal.
     Defaults to \"basic\" unless the caller explicitly requests \"advanced\".
     """
+    if raw_depth == "advanced":
+        return "advanced"
     if isinstance(raw_depth, str) and raw_depth.lower() == "advanced":
         return "advanced"
     return "basic"
 
 
+def _tavily_client_class() -> Any:
+    """Return AsyncTavilyClient, importing the tavily SDK on first use."""
+    global AsyncTavilyClient
+    if AsyncTavilyClient is None:
+        from tavily import AsyncTavilyClient as client_class
+
+        AsyncTavilyClient = client_class
+    return AsyncTavilyClient
+
+
+def _shared_client(api_key: str) -> Any:
+    """
+    Return a Tavily client reused across searches on the running event loop.
+
+    The SDK client owns an HTTP connection pool bound to the loop it was first
+    used on, so a new client is created when the loop or API key changes.
+    """
+    global _SHARED_CLIENT
+    loop = asyncio.get_running_loop()
+    if _SHARED_CLIENT is not None:
+        cached_key, cached_loop, client = _SHARED_CLIENT
+        if cached_key == api_key and cached_loop is loop:
+            return client
+    client = _tavily_client_class()(api_key=api_key)
+    _SHARED_CLIENT = (api_key, loop, client)
+    return client
+
+
+async def close_tavily_client() -> None:
+    """Close the shared Tavily client, if one was created."""
+    global _SHARED_CLIENT
+    if _SHARED_CLIENT is None:
+        return
+    _, _, client = _SHARED_CLIENT
+    _SHARED_CLIENT = None
+    close = getattr(client, "close", None)
+    if close is not None:
+        await close()
+
+
 # ====================================================
 # Tool Implementation
 # ====================================================
 
+async def _search(api_key: str, query: str, depth: TavilySearchDepth, max_results: int) -> tuple[str, bool]:
+    """Run one Tavily search, returning the JSON payload and whether it succeeded."""
+    try:
+        client = _shared_client(api_key)
+        response = await client.search(
+            query=query,
+            search_depth=depth,
+            max_results=max_results
+        )
+        return json.dumps(response, separators=(",", ":")), True
+    except Exception as e:
+        return json.dumps({"error": f"An error occurred during the Tavily search: {str(e)}"}), False
+
+
 async def run_tavily_search(
     query: str,
     search_depth: str = "basic",
-    max_results: int = 5
+    max_results: int = 5,
+    no_cache: bool = False,
 ) -> str:
     """
     Asynchronously performs a web search using the Tavily API.
 
+    Concurrent calls with the same arguments share a single request.
+
     Args:
         query: The search query.
         search_depth: The depth of the search ('basic' or 'advanced').
         max_results: The maximum number of results to return.
+        no_cache: Skip the in-process result cache and request sharing for this search.
 
     Returns:
         A JSON string containing the search results or an error message.
@@ -98,14 +171,32 @@ async def run_tavily_search(
         # Ensure max_results and search depth are within the valid ranges
         clamped_max_results = max(1, min(max_results, 10))
         depth = _normalize_search_depth(search_depth)
-
-        client = AsyncTavilyClient(api_key=api_key)
-        response = await client.search(
-            query=query,
-            search_depth=depth,
-            max_results=clamped_max_results
-        )
-        return json.dumps(response, indent=2)
-
     except Exception as e:
         return json.dumps({"error": f"An error occurred during the Tavily search: {str(e)}"})
+
+    if no_cache:
+        result_json, _ = await _search(api_key, query, depth, clamped_max_results)
+        return result_json
+
+    cache_key = (depth, clamped_max_results, query)
+    cached = _SEARCH_CACHE.get(cache_key)
+    if cached is not None and time.monotonic() - cached[0] < _SEARCH_CACHE_TTL_SECONDS:
+        return cached[1]
+
+    inflight = _INFLIGHT_SEARCHES.get(cache_key)
+    if inflight is not None:
+        # Shield so a cancelled follower cannot cancel the leader's result.
+        return await asyncio.shield(inflight)
+
+    future: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+    _INFLIGHT_SEARCHES[cache_key] = future
+    try:
+        result_json, succeeded = await _search(api_key, query, depth, clamped_max_results)
+        if succeeded:
+            _SEARCH_CACHE[cache_key] = (time.monotonic(), result_json)
+        future.set_result(result_json)
+        return result_json
+    finally:
+        _INFLIGHT_SEARCHES.pop(cache_key, None)
+        if not future.done():
+            future.cancel()
@@ -3,22 +3,25 @@ from __future__ import annotations
 
 import json
 import logging
-from collections.abc import AsyncIterator, Iterator
+from collections.abc import AsyncIterator, Callable, Iterator
 from typing import Any
 
 from agentrules.core.agents.base import BaseArchitect, ModelProvider, ReasoningMode
 from agentrules.core.streaming import StreamChunk, StreamEventType
 from agentrules.core.utils.async_stream import iterate_in_thread
+from agentrules.core.utils.model_config_helper import get_model_config_name
 from agentrules.core.utils.token_estimator import compute_effective_limits, estimate_tokens
 
-from .client import execute_message_request, execute_message_stream, get_client
-from .prompting import default_prompt_template, format_prompt
+from .client import collect_message_stream_async, execute_message_stream, get_client
+from .prompting import default_prompt_template, fill_context, render_persona_prompt
 from .request_builder import PreparedRequest, prepare_request
 from .response_parser import parse_response
 from .tooling import resolve_tool_config
 
 logger = logging.getLogger("project_extractor")
 
+_PROGRESS_LOG_INTERVAL_CHARS = 4_000
+
 
 class AnthropicArchitect(BaseArchitect):
     """Architect class for interacting with Anthropic's Claude models."""
@@ -45,6 +48,8 @@ class AnthropicArchitect(BaseArchitect):
             model_config=model_config,
         )
         self.prompt_template = prompt_template or default_prompt_template()
+        # (template, rendered persona prompt); re-rendered if prompt_template is replaced.
+        self._persona_prompt: tuple[str, str] | None = None
 
     @property
     def supports_streaming(self) -> bool:
@@ -52,13 +57,16 @@ class AnthropicArchitect(BaseArchitect):
 
     # Public API -----------------------------------------------------------------
     def format_prompt(self, context: dict[str, Any]) -> str:
-        return format_prompt(
-            template=self.prompt_template,
-            agent_name=self.name or "Claude Architect",
-            agent_role=self.role or "analyzing the project",
-            responsibilities=self.responsibilities,
-            context=context,
-        )
+        template = self.prompt_template
+        if self._persona_prompt is None or self._persona_prompt[0] is not template:
+            persona_prompt = render_persona_prompt(
+                template=template,
+                agent_name=self.name or "Claude Architect",
+                agent_role=self.role or "analyzing the project",
+                responsibilities=self.responsibilities,
+            )
+            self._persona_prompt = (template, persona_prompt)
+        return fill_context(self._persona_prompt[1], context)
 
     async def analyze(self, context: dict[str, Any], tools: list[Any] | None = None) -> dict[str, Any]:
         try:
@@ -67,33 +75,25 @@ class AnthropicArchitect(BaseArchitect):
             prepared = self._prepare_request(prompt, provider_tools)
             self._log_token_estimate(prepared)
 
-            from agentrules.core.utils.model_config_helper import get_model_config_name  # Local import to avoid cycles
-
-            model_config_name = get_model_config_name(self)
             agent_name = self.name or "Claude Architect"
-            detail_parts: list[str] = []
-            if "thinking" in prepared.payload:
-                thinking = prepared.payload["thinking"]
-                if isinstance(thinking, dict):
-                    budget = thinking.get("budget_tokens")
-                    detail = thinking.get("type")
-                    if detail == "enabled" and budget:
-                        detail_parts.append(f"with thinking (budget={budget})")
-                    elif detail:
-                        detail_parts.append(f"with thinking ({detail})")
-            if provider_tools:
-                detail_parts.append("with tools enabled")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "[bold purple]%s:[/bold purple] Sending request to %s (Config: %s)%s",
+                    agent_name,
+                    self.model_name,
+                    get_model_config_name(self),
+                    self._request_detail_suffix(prepared, provider_tools),
+                )
 
-            detail_suffix = f" ({', '.join(detail_parts)})" if detail_parts else ""
-            logger.info(
-                f"[bold purple]{agent_name}:[/bold purple] Sending request to {self.model_name} "
-                f"(Config: {model_config_name}){detail_suffix}"
+            response = await collect_message_stream_async(
+                prepared.payload,
+                on_text_delta=self._text_progress_logger(agent_name),
             )
 
-            response = execute_message_request(prepared.payload)
-
             logger.info(
-                f"[bold green]{agent_name}:[/bold green] Received response from {self.model_name}"
+                "[bold green]%s:[/bold green] Received response from %s",
+                agent_name,
+                self.model_name,
             )
 
             parsed = parse_response(response)
@@ -104,14 +104,12 @@ class AnthropicArchitect(BaseArchitect):
             }
 
             if parsed.tool_calls:
-                logger.info(
-                    f"[bold purple]{agent_name}:[/bold purple] Model requested tool call(s)."
-                )
+                logger.info("[bold purple]%s:[/bold purple] Model requested tool call(s).", agent_name)
 
             return results
         except Exception as exc:  # pragma: no cover - defensive logging
             agent_name = self.name or "Claude Architect"
-            logger.error(f"[bold red]Error in {agent_name}:[/bold red] {str(exc)}")
+            logger.error("[bold red]Error in %s:[/bold red] %s", agent_name, exc)
             return {
                 "agent": agent_name,
                 "error": str(exc),
@@ -128,8 +126,6 @@ class AnthropicArchitect(BaseArchitect):
             prepared = self._prepare_request(prompt, provider_tools)
             self._log_token_estimate(prepared)
 
-            from agentrules.core.utils.model_config_helper import get_model_config_name  # Local import to avoid cycles
-
             model_config_name = get_model_config_name(self)
             agent_name = self.name or "Claude Architect"
             detail_parts: list[str] = []
@@ -202,7 +198,7 @@ class AnthropicArchitect(BaseArchitect):
     async def consolidate_results(self, all_results: dict, prompt: str | None = None) -> dict[str, Any]:
         content = prompt or (
             "Consolidate these results into a comprehensive report:\n\n"
-            f"{json.dumps(all_results, indent=2)}"
+            + json.dumps(all_results, separators=(",", ":"))
         )
 
         result = await self.analyze({"formatted_prompt": content})
@@ -230,6 +226,41 @@ class AnthropicArchitect(BaseArchitect):
             effort=getattr(self._model_config, "anthropic_effort", None),
         )
 
+    @staticmethod
+    def _request_detail_suffix(prepared: PreparedRequest, provider_tools: list[Any] | None) -> str:
+        detail_parts: list[str] = []
+        thinking = prepared.payload.get("thinking")
+        if isinstance(thinking, dict):
+            budget = thinking.get("budget_tokens")
+            detail = thinking.get("type")
+            if detail == "enabled" and budget:
+                detail_parts.append(f"with thinking (budget={budget})")
+            elif detail:
+                detail_parts.append(f"with thinking ({detail})")
+        if provider_tools:
+            detail_parts.append("with tools enabled")
+        return f" ({', '.join(detail_parts)})" if detail_parts else ""
+
+    def _text_progress_logger(self, agent_name: str) -> Callable[[str], None] | None:
+        if not logger.isEnabledFor(logging.DEBUG):
+            return None
+
+        received = 0
+        next_report = 0
+
+        def _on_text_delta(text: str) -> None:
+            nonlocal received, next_report
+            received += len(text)
+            if received < next_report:
+                return
+            if next_report == 0:
+                logger.debug(f"{agent_name}: first text received from {self.model_name}")
+            else:
+                logger.debug(f"{agent_name}: streamed {received} characters from {self.model_name}")
+            next_report = (received // _PROGRESS_LOG_INTERVAL_CHARS + 1) * _PROGRESS_LOG_INTERVAL_CHARS
+
+        return _on_text_delta
+
     def _log_token_estimate(self, prepared: PreparedRequest) -> None:
         result = estimate_tokens(
             provider=self.provider,
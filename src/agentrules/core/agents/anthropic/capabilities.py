@@ -6,29 +6,32 @@ don't duplicate allowlists across request builders and architects.
 
 from __future__ import annotations
 
+from functools import lru_cache
+
+_ADAPTIVE_THINKING_MODELS = frozenset({"claude-opus-4-6"})
+_ADAPTIVE_THINKING_PREFIXES = ("claude-opus-4-6-",)
+_EFFORT_MODELS = frozenset({"claude-opus-4-6", "claude-opus-4-5"})
+_EFFORT_PREFIXES = ("claude-opus-4-6-", "claude-opus-4-5-")
+
 
 def normalize_model_name(model_name: str) -> str:
     return model_name.strip().lower()
 
 
+@lru_cache(maxsize=32)
 def supports_adaptive_thinking(model_name: str) -> bool:
     """Return True when the model supports thinking.type='adaptive'."""
     normalized = normalize_model_name(model_name)
-    return normalized == "claude-opus-4-6" or normalized.startswith("claude-opus-4-6-")
+    return normalized in _ADAPTIVE_THINKING_MODELS or normalized.startswith(_ADAPTIVE_THINKING_PREFIXES)
 
 
+@lru_cache(maxsize=32)
 def supports_effort(model_name: str) -> bool:
     """Return True when the model supports output_config.effort."""
     normalized = normalize_model_name(model_name)
-    return (
-        normalized == "claude-opus-4-6"
-        or normalized.startswith("claude-opus-4-6-")
-        or normalized == "claude-opus-4-5"
-        or normalized.startswith("claude-opus-4-5-")
-    )
+    return normalized in _EFFORT_MODELS or normalized.startswith(_EFFORT_PREFIXES)
 
 
 def supports_max_effort(model_name: str) -> bool:
     """Return True when effort='max' is allowed (Opus 4.6 only)."""
     return supports_adaptive_thinking(model_name)
-
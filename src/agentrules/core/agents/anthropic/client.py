@@ -1,18 +1,51 @@
 """Anthropic SDK client helpers."""
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+from collections.abc import Callable
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Any
 
-from anthropic import Anthropic
+if TYPE_CHECKING:
+    from anthropic import Anthropic, DefaultHttpxClient
+
+# Phases are separated by long model calls; keep pooled connections alive across them
+# instead of the SDK's 5s default so later phases skip a fresh TLS handshake.
+_KEEPALIVE_EXPIRY_SECONDS = 120.0
 
 _client: Anthropic | Any | None = None
 
 
+def _build_http_client() -> DefaultHttpxClient:
+    """Return the pooled HTTP client, negotiating HTTP/2 when the optional h2 package is installed."""
+    from anthropic import DEFAULT_CONNECTION_LIMITS, DefaultHttpxClient
+
+    # Build Limits from the SDK's own class: depending on the release it is built on httpx or httpx2.
+    limits_cls = type(DEFAULT_CONNECTION_LIMITS)
+    return DefaultHttpxClient(
+        http2=find_spec("h2") is not None,
+        limits=limits_cls(
+            max_connections=DEFAULT_CONNECTION_LIMITS.max_connections,
+            max_keepalive_connections=DEFAULT_CONNECTION_LIMITS.max_keepalive_connections,
+            keepalive_expiry=_KEEPALIVE_EXPIRY_SECONDS,
+        ),
+    )
+
+
 def get_client() -> Any:
-    """Return a cached Anthropic SDK client instance."""
+    """
+    Return a cached Anthropic SDK client instance.
+
+    Every architect shares this client, so concurrent phase requests reuse its
+    pooled HTTP connections instead of paying a new handshake per call. The SDK
+    is imported here, on first use, so cached or non-Anthropic runs skip its
+    import cost.
+    """
     global _client
     if _client is None:
-        _client = Anthropic()
+        from anthropic import Anthropic
+
+        _client = Anthropic(http_client=_build_http_client())
     return _client
 
 
@@ -57,3 +90,34 @@ def execute_message_stream(payload: dict) -> Any:
     """Execute a Claude Messages API streaming call with the provided payload."""
     client = get_client()
     return client.messages.stream(**_coerce_sdk_kwargs(payload))
+
+
+def collect_message_stream(
+    payload: dict,
+    on_text_delta: Callable[[str], None] | None = None,
+) -> Any:
+    """
+    Stream a Claude Messages API call and return the assembled final message.
+
+    The returned message has the same shape as a non-streaming ``messages.create``
+    response, so callers can feed it to ``parse_response`` unchanged. Text deltas
+    are forwarded to ``on_text_delta`` as they arrive.
+    """
+    with execute_message_stream(payload) as stream:
+        for event in stream:
+            if on_text_delta is None or getattr(event, "type", None) != "content_block_delta":
+                continue
+            delta = getattr(event, "delta", None)
+            if getattr(delta, "type", None) == "text_delta":
+                text = getattr(delta, "text", None)
+                if text:
+                    on_text_delta(str(text))
+        return stream.get_final_message()
+
+
+async def collect_message_stream_async(
+    payload: dict,
+    on_text_delta: Callable[[str], None] | None = None,
+) -> Any:
+    """Run ``collect_message_stream`` on a thread to avoid blocking the event loop."""
+    return await asyncio.to_thread(collect_message_stream, payload, on_text_delta)
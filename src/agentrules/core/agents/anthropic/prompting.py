@@ -24,6 +24,33 @@ def _format_responsibilities(responsibilities: Iterable[str] | None) -> str:
     return "\n".join(f"- {item}" for item in responsibilities)
 
 
+# Stands in for ``{context}`` in pre-rendered templates; NUL bytes never occur in
+# persona text, so the later ``str.replace`` cannot hit user content.
+_CONTEXT_PLACEHOLDER = "\x00context\x00"
+
+
+def render_persona_prompt(
+    *,
+    template: str,
+    agent_name: str,
+    agent_role: str,
+    responsibilities: Iterable[str] | None,
+) -> str:
+    """Render the architect metadata once, leaving a placeholder for ``fill_context``."""
+    return template.format(
+        agent_name=agent_name,
+        agent_role=agent_role,
+        agent_responsibilities=_format_responsibilities(responsibilities),
+        context=_CONTEXT_PLACEHOLDER,
+    )
+
+
+def fill_context(persona_prompt: str, context: dict[str, Any] | Any) -> str:
+    """Insert the analysis context into a prompt from ``render_persona_prompt``."""
+    context_str = json.dumps(context, separators=(",", ":")) if isinstance(context, dict) else str(context)
+    return persona_prompt.replace(_CONTEXT_PLACEHOLDER, context_str)
+
+
 def format_prompt(
     *,
     template: str,
@@ -33,10 +60,10 @@ def format_prompt(
     context: dict[str, Any] | Any,
 ) -> str:
     """Fill the template with architect metadata and analysis context."""
-    context_str = json.dumps(context, indent=2) if isinstance(context, dict) else str(context)
-    return template.format(
+    persona_prompt = render_persona_prompt(
+        template=template,
         agent_name=agent_name,
         agent_role=agent_role,
-        agent_responsibilities=_format_responsibilities(responsibilities),
-        context=context_str,
+        responsibilities=responsibilities,
     )
+    return fill_context(persona_prompt, context)
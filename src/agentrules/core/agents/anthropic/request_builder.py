@@ -14,7 +14,7 @@ DEFAULT_THINKING_BUDGET = 16_000
 _SUPPORTED_EFFORT_LEVELS: set[str] = {"low", "medium", "high", "max"}
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PreparedRequest:
     """Container for a ready-to-dispatch Anthropic request."""
 
@@ -56,10 +56,10 @@ def prepare_request(
 
 
 def _build_thinking_payload(*, model_name: str, reasoning: ReasoningMode) -> dict[str, Any] | None:
-    if reasoning == ReasoningMode.ENABLED:
+    if reasoning is ReasoningMode.ENABLED:
         return {"type": "enabled", "budget_tokens": DEFAULT_THINKING_BUDGET}
 
-    if reasoning == ReasoningMode.DYNAMIC:
+    if reasoning is ReasoningMode.DYNAMIC:
         # Claude Opus 4.6 introduced "adaptive" thinking mode. Other models do not
         # support it; fail fast so callers get an actionable error instead of a
         # confusing API 400.
@@ -71,9 +71,6 @@ def _build_thinking_payload(*, model_name: str, reasoning: ReasoningMode) -> dic
             "on other Claude models."
         )
 
-    if reasoning == ReasoningMode.DISABLED:
-        return None
-
     return None
 
 
@@ -1,9 +1,15 @@
 """Helpers for normalising Anthropic responses."""
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import dataclass
+from functools import partial
 from typing import Any
 
+# Block types that never carry tool metadata; skipping them avoids probing for
+# ``tool_use`` attributes on every text/thinking block of a plain response.
+_NON_TOOL_BLOCK_TYPES = frozenset({"text", "thinking", "redacted_thinking"})
+
 
 @dataclass(frozen=True)
 class ParsedResponse:
@@ -23,55 +29,38 @@ def parse_response(response: Any) -> ParsedResponse:
         content = response.get("content")
 
     for block in content or []:
-        text = _extract_text(block)
-        if text:
+        get = _accessor(block)
+
+        text = get("text", None)
+        if isinstance(text, str) and text:
             findings_parts.append(text)
 
-        tool_call = _extract_tool_use(block)
-        if tool_call:
-            tool_calls.append(tool_call)
+        block_type = get("type", None)
+        if block_type in _NON_TOOL_BLOCK_TYPES:
+            continue
+
+        if block_type == "tool_use":
+            tool_calls.append(_tool_call(get))
+            continue
+
+        tool_use = get("tool_use", None)
+        if tool_use:
+            tool_calls.append(_tool_call(_accessor(tool_use)))
 
     findings = "\n".join(findings_parts).strip() or None
     return ParsedResponse(findings=findings, tool_calls=tool_calls or None)
 
 
-def _extract_text(block: Any) -> str | None:
-    if isinstance(block, dict):
-        text = block.get("text")
-        if isinstance(text, str):
-            return text
-        return None
-
-    return getattr(block, "text", None)
-
-
-def _extract_tool_use(block: Any) -> dict[str, Any] | None:
-    if isinstance(block, dict):
-        if block.get("type") == "tool_use":
-            return {
-                "id": block.get("id"),
-                "name": block.get("name"),
-                "input": block.get("input"),
-            }
-        tool_use = block.get("tool_use")
-    else:
-        if getattr(block, "type", None) == "tool_use":
-            return {
-                "id": getattr(block, "id", None),
-                "name": getattr(block, "name", None),
-                "input": getattr(block, "input", None),
-            }
-        tool_use = getattr(block, "tool_use", None)
-
-    if not tool_use:
-        return None
-
-    tool_id = getattr(tool_use, "id", None) if not isinstance(tool_use, dict) else tool_use.get("id")
-    tool_name = getattr(tool_use, "name", None) if not isinstance(tool_use, dict) else tool_use.get("name")
-    tool_input = getattr(tool_use, "input", None) if not isinstance(tool_use, dict) else tool_use.get("input")
+def _accessor(obj: Any) -> Callable[[str, Any], Any]:
+    """Return a ``get(name, default)`` callable for dict or SDK-object blocks."""
+    if isinstance(obj, dict):
+        return obj.get
+    return partial(getattr, obj)
+
 
+def _tool_call(get: Callable[[str, Any], Any]) -> dict[str, Any]:
     return {
-        "id": tool_id,
-        "name": tool_name,
-        "input": tool_input,
+        "id": get("id", None),
+        "name": get("name", None),
+        "input": get("input", None),
     }
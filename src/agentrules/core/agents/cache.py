@@ -0,0 +1,155 @@
+"""Opt-in on-disk cache for provider responses.
+
+Entries are plain JSON files keyed by a content hash of everything that shapes
+a request (provider, model, reasoning mode, system instruction, tool names and
+prompt). The cache is enabled by pointing ``AGENTRULES_RESPONSE_CACHE_DIR`` at a
+directory, which ``agentrules analyze --cache-dir`` does for a single run.
+``AGENTRULES_RESPONSE_CACHE_TTL`` optionally expires entries after that many
+seconds.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from collections.abc import Iterable, Mapping
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger("project_extractor")
+
+RESPONSE_CACHE_ENV_VAR = "AGENTRULES_RESPONSE_CACHE_DIR"
+RESPONSE_CACHE_TTL_ENV_VAR = "AGENTRULES_RESPONSE_CACHE_TTL"
+_CACHE_FORMAT_VERSION = 1
+
+
+def response_cache_key(
+    *,
+    provider: str,
+    model_name: str,
+    reasoning: str,
+    system_instruction: str | None,
+    tool_names: Iterable[str],
+    prompt: str,
+) -> str:
+    """
+    Return a stable hex digest identifying a request.
+
+    Each component is length-prefixed before hashing so adjacent fields cannot
+    collide by shifting bytes between them.
+    """
+    digest = hashlib.sha256()
+    components = (
+        provider,
+        model_name,
+        reasoning,
+        system_instruction or "",
+        "\x1f".join(sorted(tool_names)),
+        prompt,
+    )
+    for component in components:
+        encoded = component.encode("utf-8")
+        digest.update(len(encoded).to_bytes(8, "big"))
+        digest.update(encoded)
+    return digest.hexdigest()
+
+
+class ResponseCache:
+    """Directory-backed store mapping request keys to JSON-serialisable results."""
+
+    def __init__(self, directory: Path, ttl_seconds: float | None = None) -> None:
+        self.directory = directory
+        self.ttl_seconds = ttl_seconds
+
+    def get(self, key: str, *, required_keys: Iterable[str] = ()) -> dict[str, Any] | None:
+        """Return the cached result for ``key``, evicting entries that fail validation."""
+        path = self._path_for(key)
+        try:
+            envelope = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            self._evict(path)
+            return None
+
+        value = envelope.get("value") if isinstance(envelope, dict) else None
+        if (
+            not isinstance(value, dict)
+            or envelope.get("version") != _CACHE_FORMAT_VERSION
+            or any(required not in value for required in required_keys)
+            or self._is_expired(envelope.get("created_at"))
+        ):
+            self._evict(path)
+            return None
+        return value
+
+    def put(self, key: str, value: Mapping[str, Any], metadata: Mapping[str, Any] | None = None) -> None:
+        """Persist ``value`` atomically; failures are logged and otherwise ignored."""
+        envelope = {
+            "version": _CACHE_FORMAT_VERSION,
+            "created_at": datetime.now(UTC).isoformat(),
+            "metadata": dict(metadata or {}),
+            "value": dict(value),
+        }
+        path = self._path_for(key)
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(envelope, default=str), encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            logger.debug("Failed to write response cache entry %s: %s", path, exc)
+
+    def _is_expired(self, created_at: Any) -> bool:
+        if self.ttl_seconds is None:
+            return False
+        try:
+            created = datetime.fromisoformat(created_at)
+        except (TypeError, ValueError):
+            return True
+        if created.tzinfo is None:
+            # put() writes aware UTC stamps; a naive one cannot be compared, so treat the entry as stale
+            return True
+        return (datetime.now(UTC) - created).total_seconds() > self.ttl_seconds
+
+    def _path_for(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    @staticmethod
+    def _evict(path: Path) -> None:
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+
+def get_response_cache() -> ResponseCache | None:
+    """Return the configured response cache, or ``None`` when caching is disabled."""
+    directory = os.getenv(RESPONSE_CACHE_ENV_VAR)
+    if not directory:
+        return None
+
+    ttl_seconds: float | None = None
+    raw_ttl = os.getenv(RESPONSE_CACHE_TTL_ENV_VAR)
+    if raw_ttl:
+        try:
+            ttl_seconds = float(raw_ttl)
+        except ValueError:
+            logger.warning(
+                "Ignoring invalid %s=%r; cached responses will not expire.",
+                RESPONSE_CACHE_TTL_ENV_VAR,
+                raw_ttl,
+            )
+    return ResponseCache(Path(directory).expanduser(), ttl_seconds=ttl_seconds)
+
+
+__all__ = [
+    "RESPONSE_CACHE_ENV_VAR",
+    "RESPONSE_CACHE_TTL_ENV_VAR",
+    "ResponseCache",
+    "get_response_cache",
+    "response_cache_key",
+]
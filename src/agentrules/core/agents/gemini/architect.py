@@ -6,17 +6,20 @@ import json
 import logging
 import os
 from collections.abc import AsyncIterator, Iterator
+from dataclasses import dataclass
 from typing import Any, cast
 
 from google.genai import types as genai_types
 
 from agentrules.core.agents.base import BaseArchitect, ModelProvider, ReasoningMode
+from agentrules.core.agents.cache import get_response_cache, response_cache_key
 from agentrules.core.streaming import StreamChunk, StreamEventType
 from agentrules.core.utils.async_stream import iterate_in_thread
+from agentrules.core.utils.model_config_helper import get_model_config_name
 from agentrules.core.utils.token_estimator import compute_effective_limits, estimate_tokens
 
 from .client import build_gemini_client, generate_content_async
-from .prompting import default_prompt_template, format_prompt
+from .prompting import default_prompt_template, fill_context, render_persona_prompt
 from .response_parser import (
     _collect_candidate_parts,
     _extract_function_call_args,
@@ -36,6 +39,15 @@ DYNAMIC_THINKING_BUDGET = -1
 DISABLED_THINKING_BUDGET = 0
 
 
+@dataclass(frozen=True, slots=True)
+class _RequestConfig:
+    """SDK config plus the derived values analyze/stream_analyze log and cache on."""
+
+    generation_config: Any | None
+    api_tools: list[Any] | None
+    detail_suffix: str
+
+
 class GeminiArchitect(BaseArchitect):
     """Architect class for interacting with Google's Gemini models."""
 
@@ -62,6 +74,15 @@ class GeminiArchitect(BaseArchitect):
             model_config=model_config,
         )
         self.prompt_template = prompt_template or default_prompt_template()
+        self._normalized_model_name = model_name.lower()
+        self._default_request_config: _RequestConfig | None = None
+        self._config_name: str | None = None
+        # (template, rendered persona prompt); re-rendered if prompt_template is replaced.
+        self._persona_prompt: tuple[str, str] | None = None
+        # Identical on every request, so Gemini's implicit prefix caching can reuse it.
+        self._system_instruction = (
+            f"You are {self.name or 'an AI assistant'}, responsible for {self.role}." if self.role else None
+        )
         google_key = os.environ.get("GOOGLE_API_KEY")
         gemini_key = os.environ.get("GEMINI_API_KEY")
         if gemini_key and not google_key:
@@ -90,13 +111,16 @@ class GeminiArchitect(BaseArchitect):
 
     # Public API -----------------------------------------------------------------
     def format_prompt(self, context: dict[str, Any]) -> str:
-        return format_prompt(
-            template=self.prompt_template,
-            agent_name=self.name or "Gemini Architect",
-            agent_role=self.role or "analyzing the project",
-            responsibilities=self.responsibilities,
-            context=context,
-        )
+        template = self.prompt_template
+        if self._persona_prompt is None or self._persona_prompt[0] is not template:
+            persona_prompt = render_persona_prompt(
+                template=template,
+                agent_name=self.name or "Gemini Architect",
+                agent_role=self.role or "analyzing the project",
+                responsibilities=self.responsibilities,
+            )
+            self._persona_prompt = (template, persona_prompt)
+        return fill_context(self._persona_prompt[1], context)
 
     async def analyze(self, context: dict[str, Any], tools: list[Any] | None = None) -> dict[str, Any]:
         client = self.client
@@ -105,31 +129,36 @@ class GeminiArchitect(BaseArchitect):
 
         prompt = context.get("formatted_prompt") or self.format_prompt(context)
 
-        config_kwargs: dict[str, Any] = {}
-        if self.role:
-            config_kwargs["system_instruction"] = (
-                f"You are {self.name or 'an AI assistant'}, responsible for {self.role}."
-            )
-
-        api_tools = resolve_tool_config(tools, self.tools_config)
-        if api_tools:
-            config_kwargs["tools"] = api_tools
-
-        thinking_config = self._build_thinking_config()
-        if thinking_config is not None:
-            config_kwargs["thinking_config"] = thinking_config
-
-        generation_config = GenerateContentConfig(**config_kwargs) if config_kwargs else None
+        request_config = self._request_config(tools)
+        generation_config = request_config.generation_config
+        api_tools = request_config.api_tools
 
         agent_name = self.name or "Gemini Architect"
-        detail_suffix = self._compose_request_detail_suffix(thinking_config, api_tools)
 
-        from agentrules.core.utils.model_config_helper import get_model_config_name  # Local import to avoid cycle
+        cache = get_response_cache()
+        cache_key: str | None = None
+        if cache is not None:
+            cache_key = response_cache_key(
+                provider=self.provider.value,
+                model_name=self.model_name,
+                reasoning=self.reasoning.value,
+                system_instruction=self._system_instruction,
+                tool_names=_tool_names(api_tools),
+                prompt=prompt,
+            )
+            cached = cache.get(cache_key, required_keys=("agent", "findings"))
+            if cached is not None:
+                logger.info(
+                    "[bold magenta]%s:[/bold magenta] Using cached response from %s", agent_name, self.model_name
+                )
+                return cached
 
-        model_config_name = get_model_config_name(self)
         logger.info(
-            f"[bold magenta]{agent_name}:[/bold magenta] Sending request to {self.model_name} "
-            f"(Config: {model_config_name}){detail_suffix}"
+            "[bold magenta]%s:[/bold magenta] Sending request to %s (Config: %s)%s",
+            agent_name,
+            self.model_name,
+            self._model_config_name(),
+            request_config.detail_suffix,
         )
 
         response = await generate_content_async(
@@ -140,7 +169,7 @@ class GeminiArchitect(BaseArchitect):
         )
         self._log_token_estimate(prompt, generation_config)
 
-        logger.info(f"[bold green]{agent_name}:[/bold green] Received response from {self.model_name}")
+        logger.info("[bold green]%s:[/bold green] Received response from %s", agent_name, self.model_name)
 
         parsed = parse_generate_response(response)
         result: dict[str, Any] = {
@@ -149,10 +178,22 @@ class GeminiArchitect(BaseArchitect):
         }
         if parsed.function_calls:
             result["function_calls"] = parsed.function_calls
-            logger.info(f"[bold magenta]{agent_name}:[/bold magenta] Model requested function call(s).")
+            logger.info("[bold magenta]%s:[/bold magenta] Model requested function call(s).", agent_name)
             if not parsed.findings:
                 result["findings"] = None
 
+        if cache is not None and cache_key is not None:
+            cache.put(
+                cache_key,
+                result,
+                {
+                    "model": self.model_name,
+                    "reasoning": self.reasoning.value,
+                    "config": self._model_config_name(),
+                    "tools": _tool_names(api_tools),
+                },
+            )
+
         return result
 
     async def create_analysis_plan(self, phase1_results: dict, prompt: str | None = None) -> dict[str, Any]:
@@ -195,10 +236,26 @@ class GeminiArchitect(BaseArchitect):
 
         content = prompt or (
             "Consolidate these results into a comprehensive report:\n\n"
-            f"{json.dumps(all_results, indent=2)}"
+            + json.dumps(all_results, separators=(",", ":"))
         )
 
         model_name = self._resolve_consolidation_model()
+
+        cache = get_response_cache()
+        cache_key: str | None = None
+        if cache is not None:
+            cache_key = response_cache_key(
+                provider=self.provider.value,
+                model_name=model_name,
+                reasoning=self.reasoning.value,
+                system_instruction=None,
+                tool_names=(),
+                prompt=content,
+            )
+            cached = cache.get(cache_key, required_keys=("phase", "report"))
+            if cached is not None:
+                return cached
+
         response = await generate_content_async(
             client,
             model=model_name,
@@ -207,10 +264,13 @@ class GeminiArchitect(BaseArchitect):
         )
 
         parsed = parse_generate_response(response)
-        return {
+        result = {
             "phase": "Consolidation",
             "report": parsed.findings or "No report generated",
         }
+        if cache is not None and cache_key is not None:
+            cache.put(cache_key, result, {"model": model_name, "reasoning": self.reasoning.value})
+        return result
 
     def stream_analyze(
         self,
@@ -224,31 +284,16 @@ class GeminiArchitect(BaseArchitect):
 
             prompt = context.get("formatted_prompt") or self.format_prompt(context)
 
-            config_kwargs: dict[str, Any] = {}
-            if self.role:
-                config_kwargs["system_instruction"] = (
-                    f"You are {self.name or 'an AI assistant'}, responsible for {self.role}."
-                )
-
-            api_tools = resolve_tool_config(tools, self.tools_config)
-            if api_tools:
-                config_kwargs["tools"] = api_tools
-
-            thinking_config = self._build_thinking_config()
-            if thinking_config is not None:
-                config_kwargs["thinking_config"] = thinking_config
-
-            generation_config = genai_types.GenerateContentConfig(**config_kwargs) if config_kwargs else None
+            request_config = self._request_config(tools)
+            generation_config = request_config.generation_config
 
             agent_name = self.name or "Gemini Architect"
-            detail_suffix = self._compose_request_detail_suffix(thinking_config, api_tools)
-
-            from agentrules.core.utils.model_config_helper import get_model_config_name  # Local import to avoid cycle
-
-            model_config_name = get_model_config_name(self)
             logger.info(
-                f"[bold magenta]{agent_name}:[/bold magenta] Streaming request to {self.model_name} "
-                f"(Config: {model_config_name}){detail_suffix}"
+                "[bold magenta]%s:[/bold magenta] Streaming request to %s (Config: %s)%s",
+                agent_name,
+                self.model_name,
+                self._model_config_name(),
+                request_config.detail_suffix,
             )
 
             self._log_token_estimate(prompt, generation_config)
@@ -259,12 +304,43 @@ class GeminiArchitect(BaseArchitect):
                 ):
                     yield chunk
             except Exception as exc:  # pragma: no cover - defensive logging
-                logger.error(f"[bold red]Streaming error in {agent_name}:[/bold red] {str(exc)}")
+                logger.error("[bold red]Streaming error in %s:[/bold red] %s", agent_name, exc)
                 raise
 
         return _generator()
 
     # Internal helpers -----------------------------------------------------------
+    def _request_config(self, tools: list[Any] | None) -> _RequestConfig:
+        """Build the per-request SDK config, reusing it when only ``tools_config`` applies."""
+        if tools is None and self._default_request_config is not None:
+            return self._default_request_config
+
+        config_kwargs: dict[str, Any] = {}
+        if self._system_instruction:
+            config_kwargs["system_instruction"] = self._system_instruction
+
+        api_tools = resolve_tool_config(tools, self.tools_config)
+        if api_tools:
+            config_kwargs["tools"] = api_tools
+
+        thinking_config = self._build_thinking_config()
+        if thinking_config is not None:
+            config_kwargs["thinking_config"] = thinking_config
+
+        request_config = _RequestConfig(
+            generation_config=GenerateContentConfig(**config_kwargs) if config_kwargs else None,
+            api_tools=api_tools,
+            detail_suffix=self._compose_request_detail_suffix(thinking_config, api_tools),
+        )
+        if tools is None:
+            self._default_request_config = request_config
+        return request_config
+
+    def _model_config_name(self) -> str:
+        if self._config_name is None:
+            self._config_name = get_model_config_name(self)
+        return self._config_name
+
     def _resolve_consolidation_model(self) -> str:
         if self.reasoning == ReasoningMode.DISABLED:
             return self.model_name
@@ -297,7 +373,7 @@ class GeminiArchitect(BaseArchitect):
             detail += f" limit={limit}"
         if effective:
             detail += f" effective_limit={effective}"
-        logger.info(f"[bold magenta]Token preflight:[/bold magenta] {detail}")
+        logger.info("[bold magenta]Token preflight:[/bold magenta] %s", detail)
 
     def _compose_request_detail_suffix(
         self,
@@ -374,16 +450,14 @@ class GeminiArchitect(BaseArchitect):
     def _model_supports_disabling_thinking(self) -> bool:
         if self._model_supports_thinking_level():
             return False
-        normalized = self.model_name.lower()
         # Gemini 2.5 Pro does not allow disabling thinking according to the docs.
-        return "gemini-2.5-pro" not in normalized
+        return "gemini-2.5-pro" not in self._normalized_model_name
 
     def _model_supports_thinking_level(self) -> bool:
-        normalized = self.model_name.lower()
-        return "gemini-3" in normalized
+        return "gemini-3" in self._normalized_model_name
 
     def _stable_model_name(self) -> str:
-        normalized = self.model_name.lower()
+        normalized = self._normalized_model_name
         if "gemini-2.5-flash" in normalized:
             return "gemini-2.5-flash"
         if "gemini-2.5-pro" in normalized:
@@ -468,3 +542,18 @@ class GeminiArchitect(BaseArchitect):
                 if not key.startswith("_")
             }
         return None
+
+
+def _tool_names(api_tools: list[Any] | None) -> list[str]:
+    """Return the function names declared by Gemini tool objects or dict fallbacks."""
+    names: list[str] = []
+    for tool in api_tools or []:
+        if isinstance(tool, dict):
+            declarations = tool.get("function_declarations") or []
+        else:
+            declarations = getattr(tool, "function_declarations", None) or []
+        for declaration in declarations:
+            name = declaration.get("name") if isinstance(declaration, dict) else getattr(declaration, "name", None)
+            if name:
+                names.append(str(name))
+    return names
@@ -3,24 +3,38 @@
 from __future__ import annotations
 
 import asyncio
+import contextvars
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache, lru_cache, partial
 from typing import Any
 
 from google import genai
+from google.genai import types as genai_types
 
 logger = logging.getLogger("project_extractor")
 
+MAX_CONCURRENCY_ENV_VAR = "AGENTRULES_GEMINI_MAX_CONCURRENCY"
+DEFAULT_MAX_CONCURRENCY = 16
+
+# Let the SDK retry transient failures (408/429/5xx and connection errors) with
+# exponential backoff and jitter instead of failing the whole phase.
+_HTTP_OPTIONS = genai_types.HttpOptions(
+    retry_options=genai_types.HttpRetryOptions(attempts=4, initial_delay=1.0, max_delay=16.0),
+)
+
 
 def build_gemini_client(api_key: str | None) -> tuple[genai.Client | None, str | None]:
     """
     Attempt to build the Gemini client and return the instance plus an error hint.
 
     Returning the error string instead of raising preserves the legacy behaviour
-    where client construction failures are surfaced on first use.
+    where client construction failures are surfaced on first use. Successful
+    clients are shared per API key so architects reuse one connection pool.
     """
     try:
-        client = genai.Client(api_key=api_key) if api_key else genai.Client()
-        return client, None
+        return _shared_client(genai.Client, api_key), None
     except Exception as exc:  # pragma: no cover - defensive logging
         logger.debug("Gemini client creation failed", exc_info=exc)
         hint = (
@@ -30,6 +44,31 @@ def build_gemini_client(api_key: str | None) -> tuple[genai.Client | None, str |
         return None, hint
 
 
+@lru_cache(maxsize=4)
+def _shared_client(client_cls: type[genai.Client], api_key: str | None) -> genai.Client:
+    # Keyed on the class as well so tests that monkeypatch ``genai.Client`` get their stand-in.
+    if api_key:
+        return client_cls(api_key=api_key, http_options=_HTTP_OPTIONS)
+    return client_cls(http_options=_HTTP_OPTIONS)
+
+
+def reset_gemini_clients() -> None:
+    """Drop shared Gemini clients (primarily for tests and key rotation)."""
+    _shared_client.cache_clear()
+
+
+@cache
+def _gemini_executor() -> ThreadPoolExecutor:
+    """Worker pool dedicated to blocking Gemini calls, sized by ``MAX_CONCURRENCY_ENV_VAR``."""
+    raw = os.getenv(MAX_CONCURRENCY_ENV_VAR, "")
+    try:
+        max_workers = int(raw) if raw else DEFAULT_MAX_CONCURRENCY
+    except ValueError:
+        logger.warning("Ignoring invalid %s=%r; using %d.", MAX_CONCURRENCY_ENV_VAR, raw, DEFAULT_MAX_CONCURRENCY)
+        max_workers = DEFAULT_MAX_CONCURRENCY
+    return ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="gemini")
+
+
 async def generate_content_async(
     client: genai.Client,
     *,
@@ -37,10 +76,20 @@ async def generate_content_async(
     contents: str,
     config: Any | None,
 ) -> Any:
-    """Run ``models.generate_content`` on a thread to avoid blocking the event loop."""
-    return await asyncio.to_thread(
+    """
+    Run ``models.generate_content`` on the Gemini worker pool to avoid blocking the event loop.
+
+    Phases fan out their architects with ``asyncio.gather``, so concurrent
+    requests overlap on worker threads and each returns as soon as it is done.
+    The dedicated pool keeps them from competing with other ``asyncio.to_thread``
+    work in the default executor and caps how many are in flight at once;
+    further calls queue until a worker frees up.
+    """
+    loop = asyncio.get_running_loop()
+    call = partial(
         client.models.generate_content,
         model=model,
         contents=contents,
         config=config,
     )
+    return await loop.run_in_executor(_gemini_executor(), contextvars.copy_context().run, call)
@@ -11,7 +11,8 @@ class GeminiAgent:
     """
     Legacy wrapper retained for compatibility with historical code paths.
 
-    New implementations should depend on ``GeminiArchitect`` directly.
+    Attribute access is forwarded to the wrapped ``GeminiArchitect``. New
+    implementations should depend on ``GeminiArchitect`` directly.
     """
 
     def __init__(
@@ -22,9 +23,6 @@ class GeminiAgent:
         prompt_template: str | None = None,
         api_key: str | None = None,
     ):
-        self.name = name
-        self.role = role
-        self.responsibilities = responsibilities
         self._architect = GeminiArchitect(
             name=name,
             role=role,
@@ -33,13 +31,13 @@ class GeminiAgent:
             api_key=api_key,
             tools_config=None,
         )
-        self.prompt_template = prompt_template or self._architect.prompt_template
 
-    def _format_prompt(self, context: dict[str, Any]) -> str:
-        return self._architect.format_prompt(context)
-
-    def format_prompt(self, context: dict[str, Any]) -> str:
-        return self._format_prompt(context)
+    def __getattr__(self, item: str) -> Any:
+        # Only called for attributes not defined here: name, role, responsibilities,
+        # prompt_template, format_prompt, ... all live on the wrapped architect.
+        if item == "_architect":
+            raise AttributeError(item)
+        return getattr(self._architect, item)
 
     async def analyze(self, context: dict[str, Any]) -> dict[str, Any]:
         return await self._architect.analyze(context)
@@ -21,21 +21,46 @@ Analyze this project context and provide a detailed report focused on your domai
 Format your response as a structured report with clear sections and findings."""
 
 
-def format_prompt(
+# Stands in for ``{context}`` in pre-rendered templates; NUL bytes never occur in
+# persona text, so the later ``str.replace`` cannot hit user content.
+_CONTEXT_PLACEHOLDER = "\x00context\x00"
+
+
+def render_persona_prompt(
     *,
     template: str,
     agent_name: str,
     agent_role: str,
     responsibilities: Iterable[str],
-    context: dict[str, Any],
 ) -> str:
-    """Render the analysis prompt with persona information and JSON context."""
+    """Render the persona fields once, leaving a placeholder for ``fill_context``."""
     responsibilities_str = "\n".join(f"- {item}" for item in responsibilities)
-    context_str = json.dumps(context, indent=2)
-
     return template.format(
         agent_name=agent_name,
         agent_role=agent_role,
         agent_responsibilities=responsibilities_str,
-        context=context_str,
+        context=_CONTEXT_PLACEHOLDER,
+    )
+
+
+def fill_context(persona_prompt: str, context: dict[str, Any]) -> str:
+    """Insert the JSON-encoded context into a prompt from ``render_persona_prompt``."""
+    return persona_prompt.replace(_CONTEXT_PLACEHOLDER, json.dumps(context, indent=2))
+
+
+def format_prompt(
+    *,
+    template: str,
+    agent_name: str,
+    agent_role: str,
+    responsibilities: Iterable[str],
+    context: dict[str, Any],
+) -> str:
+    """Render the analysis prompt with persona information and JSON context."""
+    persona_prompt = render_persona_prompt(
+        template=template,
+        agent_name=agent_name,
+        agent_role=agent_role,
+        responsibilities=responsibilities,
     )
+    return fill_context(persona_prompt, context)
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
+from itertools import chain
 from typing import Any
 
 from google.protobuf.struct_pb2 import Struct
@@ -18,15 +20,13 @@ class GeminiParsedResponse:
 
 def _collect_candidate_parts(response: Any) -> list[Any]:
     """Safely collect all content parts from a Gemini response."""
-    parts: list[Any] = []
     candidates = getattr(response, "candidates", None) or []
-    for candidate in candidates:
-        content = getattr(candidate, "content", None)
-        candidate_parts = getattr(content, "parts", None)
-        if not candidate_parts:
-            continue
-        parts.extend(candidate_parts)
-    return parts
+    return list(
+        chain.from_iterable(
+            getattr(getattr(candidate, "content", None), "parts", None) or ()
+            for candidate in candidates
+        )
+    )
 
 
 def _extract_function_call_args(function_call: Any) -> dict[str, Any]:
@@ -35,15 +35,16 @@ def _extract_function_call_args(function_call: Any) -> dict[str, Any]:
         return {}
 
     args_obj = getattr(function_call, "args", None)
+    if args_obj is None:
+        args_obj = getattr(function_call, "arguments", None)
+
+    # google-genai already hands back plain dicts; only other mappings (e.g. a
+    # protobuf Struct from older SDKs) need converting for callers that mutate
+    # or JSON-encode the arguments.
     if isinstance(args_obj, dict):
         return args_obj
-    if isinstance(args_obj, Struct):
-        return {key: value for key, value in args_obj.items()}
-
-    arguments_obj = getattr(function_call, "arguments", None)
-    if isinstance(arguments_obj, dict):
-        return arguments_obj
-
+    if isinstance(args_obj, Mapping | Struct):
+        return dict(args_obj.items())
     return {}
 
 
@@ -56,24 +57,21 @@ def parse_generate_response(response: Any) -> GeminiParsedResponse:
     text_segments: list[str] = []
     for part in candidate_parts:
         part_text = getattr(part, "text", None)
-        is_thought = bool(getattr(part, "thought", False))
-        if part_text and not is_thought:
+        if part_text and not getattr(part, "thought", False):
             text_segments.append(part_text)
 
+        function_call = getattr(part, "function_call", None)
+        if function_call is not None:
+            payload.function_calls.append(
+                {
+                    "name": getattr(function_call, "name", None),
+                    "args": _extract_function_call_args(function_call),
+                }
+            )
+
     if text_segments:
         payload.findings = "".join(text_segments)
     elif not candidate_parts:
         payload.findings = getattr(response, "text", None)
 
-    for part in candidate_parts:
-        function_call = getattr(part, "function_call", None)
-        if function_call is None:
-            continue
-        payload.function_calls.append(
-            {
-                "name": getattr(function_call, "name", None),
-                "args": _extract_function_call_args(function_call),
-            }
-        )
-
     return payload
@@ -13,6 +13,7 @@ from agentrules.config.prompts.phase_4_prompts import format_phase4_prompt
 from agentrules.core.agents.base import BaseArchitect, ModelProvider, ReasoningMode
 from agentrules.core.streaming import StreamChunk, StreamEventType
 from agentrules.core.utils.async_stream import iterate_in_thread
+from agentrules.core.utils.model_config_helper import get_model_config_name
 from agentrules.core.utils.token_estimator import compute_effective_limits, estimate_tokens
 
 from .client import execute_request, get_client
@@ -130,8 +131,6 @@ Format your response as a structured report with clear sections and findings."""
             prepared = self._prepare_request(content, final_tools)
             self._log_token_estimate(prepared)
 
-            from agentrules.core.utils.model_config_helper import get_model_config_name
-
             model_config_name = get_model_config_name(self)
             agent_name = self.name or "OpenAI Architect"
             detail_suffix = " with tools enabled" if final_tools else ""
@@ -180,8 +179,6 @@ Format your response as a structured report with clear sections and findings."""
             prepared = self._prepare_request(content, final_tools)
             self._log_token_estimate(prepared)
 
-            from agentrules.core.utils.model_config_helper import get_model_config_name
-
             model_config_name = get_model_config_name(self)
             agent_name = self.name or "OpenAI Architect"
             detail_suffix = " with tools enabled" if final_tools else ""
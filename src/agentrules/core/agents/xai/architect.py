@@ -9,6 +9,7 @@ from typing import Any
 from agentrules.core.agents.base import BaseArchitect, ModelProvider, ReasoningMode
 from agentrules.core.streaming import StreamChunk, StreamEventType
 from agentrules.core.utils.async_stream import iterate_in_thread
+from agentrules.core.utils.model_config_helper import get_model_config_name
 from agentrules.core.utils.token_estimator import compute_effective_limits, estimate_tokens
 
 from .client import execute_chat_completion
@@ -83,8 +84,6 @@ class XaiArchitect(BaseArchitect):
             prepared = self._prepare_request(content, provider_tools)
             self._log_token_estimate(prepared)
 
-            from agentrules.core.utils.model_config_helper import get_model_config_name  # Local import to avoid cycles
-
             model_config_name = get_model_config_name(self)
             agent_name = self.name or f"xAI {self.model_name}"
 
@@ -145,8 +144,6 @@ class XaiArchitect(BaseArchitect):
         prepared = self._prepare_request(content, provider_tools)
         self._log_token_estimate(prepared)
 
-        from agentrules.core.utils.model_config_helper import get_model_config_name  # Local import to avoid cycles
-
         model_config_name = get_model_config_name(self)
         agent_name = self.name or f"xAI {self.model_name}"
 
@@ -28,8 +28,10 @@ from agentrules.core.agents.factory.factory import get_architect_for_phase, get_
 from agentrules.core.types.tool_config import Tool
 
 try:
+    from agentrules.core.agent_tools.web_search.tavily import close_tavily_client as _close_tavily_client
     from agentrules.core.agent_tools.web_search.tavily import run_tavily_search as _run_tavily_search
 except Exception:
+    _close_tavily_client = None
     _run_tavily_search = None
 
 # ====================================================
@@ -94,6 +96,8 @@ class Phase1Analysis:
                 responsibilities=RESEARCHER_AGENT_PROMPT["responsibilities"],
                 prompt_template=PHASE_1_BASE_PROMPT
             )
+        # TOOL_SETS is static config; snapshot the researcher tools once per instance
+        self._researcher_tools: tuple[Tool, ...] = tuple(TOOL_SETS.get("RESEARCHER_TOOLS") or ())
 
     # ----------------------------------------------------
     # Run Method
@@ -146,11 +150,15 @@ class Phase1Analysis:
                 "tree_structure": tree,
             }
 
-            researcher_tools = TOOL_SETS.get("RESEARCHER_TOOLS", [])
-            research_findings = await self._run_researcher_with_tools(
-                research_context,
-                researcher_tools
-            )
+            try:
+                research_findings = await self._run_researcher_with_tools(
+                    research_context,
+                    self._researcher_tools
+                )
+            finally:
+                # Release the pooled Tavily connections; later parts never search.
+                if _close_tavily_client is not None:
+                    await _close_tavily_client()
 
             logging.info("[bold green]Phase 1, Part 2:[/bold green] Documentation research complete")
 
@@ -289,37 +297,53 @@ class Phase1Analysis:
 
     async def _handle_anthropic_tool_calls(self, tool_calls: Any) -> list[dict[str, Any]]:
         """Execute Anthropic-style tool calls and return structured results."""
-        results: list[dict[str, Any]] = []
         if not tool_calls:
-            return results
-
-        for call in tool_calls or []:
-            fn_name = (call.get("function", {}) or {}).get("name") or call.get("name")
-            raw_args = (call.get("function", {}) or {}).get("arguments")
+            return []
+
+        requests: list[tuple[Any, dict[str, Any]]] = []
+        for call in tool_calls:
+            fn_block = call.get("function") or {}
+            fn_name = fn_block.get("name") or call.get("name")
+            raw_args = fn_block.get("arguments")
+            call_input = call.get("input")
             args: dict[str, Any] = {}
             if isinstance(raw_args, str):
                 try:
                     args = json.loads(raw_args)
                 except Exception:
                     args = {}
-            elif isinstance(call.get("input"), dict):
-                args = call.get("input")
-
-            results.append(await self._execute_supported_tool(fn_name, args))
+            elif isinstance(call_input, dict):
+                args = call_input
+            requests.append((fn_name, args))
 
-        return results
+        return await self._execute_tools_concurrently(requests)
 
     async def _handle_gemini_function_calls(self, function_calls: Any) -> list[dict[str, Any]]:
         """Execute Gemini-style function calls and return structured results."""
-        results: list[dict[str, Any]] = []
         if not function_calls:
-            return results
+            return []
 
-        for fc in function_calls or []:
-            fn_name = fc.get("name")
-            args = fc.get("args", {}) or {}
-            results.append(await self._execute_supported_tool(fn_name, args))
+        return await self._execute_tools_concurrently(
+            [(fc.get("name"), fc.get("args", {}) or {}) for fc in function_calls]
+        )
 
+    async def _execute_tools_concurrently(
+        self,
+        requests: Sequence[tuple[Any, dict[str, Any]]],
+    ) -> list[dict[str, Any]]:
+        """Run independent tool calls concurrently, keeping results in request order."""
+        outcomes = await asyncio.gather(
+            *(self._execute_supported_tool(fn_name, args) for fn_name, args in requests),
+            return_exceptions=True,
+        )
+        results: list[dict[str, Any]] = []
+        for (fn_name, args), outcome in zip(requests, outcomes, strict=True):
+            if isinstance(outcome, Exception):
+                results.append({"name": fn_name, "args": args, "error": str(outcome)})
+            elif isinstance(outcome, BaseException):
+                raise outcome
+            else:
+                results.append(outcome)
         return results
 
     async def _execute_supported_tool(self, fn_name: Any, args: dict[str, Any]) -> dict[str, Any]:
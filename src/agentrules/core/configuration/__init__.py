@@ -13,6 +13,7 @@ from .constants import (
     CONFIG_DIR,
     CONFIG_FILE,
     DEFAULT_VERBOSITY,
+    DEFAULT_VERBOSITY_LEVEL,
     PROVIDER_ENV_MAP,
     RULES_FILENAME_ENV_VAR,
     TRUTHY_ENV_VALUES,
@@ -35,6 +36,7 @@ __all__ = [
     "CONFIG_DIR",
     "CONFIG_FILE",
     "DEFAULT_VERBOSITY",
+    "DEFAULT_VERBOSITY_LEVEL",
     "ExclusionOverrides",
     "FeatureToggles",
     "OutputPreferences",
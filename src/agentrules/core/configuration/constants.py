@@ -5,6 +5,7 @@ from __future__ import annotations
 import logging
 import os
 from pathlib import Path
+from types import MappingProxyType
 
 from platformdirs import user_config_dir
 
@@ -19,14 +20,18 @@ VERBOSITY_PRESETS = {
     "standard": logging.INFO,
     "verbose": logging.DEBUG,
 }
+DEFAULT_VERBOSITY_LEVEL = VERBOSITY_PRESETS[DEFAULT_VERBOSITY]
 
-PROVIDER_ENV_MAP = {
-    "anthropic": "ANTHROPIC_API_KEY",
-    "openai": "OPENAI_API_KEY",
-    "deepseek": "DEEPSEEK_API_KEY",
-    "gemini": "GOOGLE_API_KEY",
-    "xai": "XAI_API_KEY",
-    "tavily": "TAVILY_API_KEY",
-}
+# Read-only: the provider -> environment variable mapping is fixed at import time.
+PROVIDER_ENV_MAP = MappingProxyType(
+    {
+        "anthropic": "ANTHROPIC_API_KEY",
+        "openai": "OPENAI_API_KEY",
+        "deepseek": "DEEPSEEK_API_KEY",
+        "gemini": "GOOGLE_API_KEY",
+        "xai": "XAI_API_KEY",
+        "tavily": "TAVILY_API_KEY",
+    }
+)
 
 TRUTHY_ENV_VALUES = {"1", "true", "yes", "on"}
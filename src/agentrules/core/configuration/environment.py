@@ -5,10 +5,20 @@ from __future__ import annotations
 import os
 from collections.abc import MutableMapping
 
-from .constants import DEFAULT_VERBOSITY, PROVIDER_ENV_MAP, TRUTHY_ENV_VALUES, VERBOSITY_ENV_VAR, VERBOSITY_PRESETS
+from .constants import (
+    DEFAULT_VERBOSITY_LEVEL,
+    PROVIDER_ENV_MAP,
+    TRUTHY_ENV_VALUES,
+    VERBOSITY_ENV_VAR,
+    VERBOSITY_PRESETS,
+)
 from .models import CLIConfig
 from .utils import normalize_verbosity_label
 
+_PROVIDER_ENV_ITEMS: tuple[tuple[str, str], ...] = tuple(
+    (provider, env_var) for provider, env_var in PROVIDER_ENV_MAP.items() if env_var
+)
+
 
 class EnvironmentManager:
     """Thin wrapper around environment access to aid testing and reuse."""
@@ -20,9 +30,7 @@ class EnvironmentManager:
         return self._environ.get(key)
 
     def apply_provider_credentials(self, config: CLIConfig) -> None:
-        for provider, env_var in PROVIDER_ENV_MAP.items():
-            if not env_var:
-                continue
+        for provider, env_var in _PROVIDER_ENV_ITEMS:
             cfg = config.providers.get(provider)
             api_key = cfg.api_key if cfg else None
             if not api_key:
@@ -38,16 +46,10 @@ class EnvironmentManager:
         if label is None:
             label = normalize_verbosity_label(config.verbosity)
 
-        if label is None:
-            fallback = VERBOSITY_PRESETS[DEFAULT_VERBOSITY]
-            return fallback if default is None else default
-
-        level = VERBOSITY_PRESETS.get(label)
+        level = VERBOSITY_PRESETS.get(label) if label is not None else None
         if level is not None:
             return level
-
-        fallback = VERBOSITY_PRESETS[DEFAULT_VERBOSITY]
-        return fallback if default is None else default
+        return DEFAULT_VERBOSITY_LEVEL if default is None else default
 
     def is_truthy(self, key: str) -> bool:
         value = self.getenv(key)
@@ -25,6 +25,12 @@ PHASE_TITLES: dict[str, str] = {
 
 PHASE_SEQUENCE: list[str] = list(agent_settings.MODEL_PRESET_DEFAULTS.keys())
 
+# The settings menu nests the researcher under Phase 1 when both phases exist.
+RESEARCHER_GROUPED_WITH_PHASE1: bool = "phase1" in PHASE_SEQUENCE and "researcher" in PHASE_SEQUENCE
+MENU_PHASE_SEQUENCE: tuple[str, ...] = tuple(
+    phase for phase in PHASE_SEQUENCE if not (RESEARCHER_GROUPED_WITH_PHASE1 and phase == "researcher")
+)
+
 
 @dataclass(frozen=True)
 class PresetInfo:
@@ -60,6 +66,8 @@ PRESET_INFOS: dict[str, PresetInfo] = _build_preset_infos(agent_settings.MODEL_P
 
 CONFIG_MANAGER = get_config_manager()
 
+_last_applied: tuple[tuple[tuple[str, str], ...], dict[str, str]] | None = None
+
 
 def get_phase_title(phase: str) -> str:
     return PHASE_TITLES.get(phase, phase.title())
@@ -115,7 +123,13 @@ def apply_user_overrides(overrides: Mapping[str, str] | None = None) -> dict[str
     Apply user-selected model presets to the global MODEL_CONFIG.
     Returns the applied preset mapping for further inspection.
     """
+    global _last_applied
+
     overrides = overrides or CONFIG_MANAGER.get_model_overrides()
+    cache_key = tuple(sorted(overrides.items()))
+    if _last_applied is not None and _last_applied[0] == cache_key and _model_config_matches(_last_applied[1]):
+        return dict(_last_applied[1])
+
     applied: dict[str, str] = {}
 
     # reset to defaults first
@@ -134,9 +148,19 @@ def apply_user_overrides(overrides: Mapping[str, str] | None = None) -> dict[str
         agent_settings.MODEL_CONFIG[phase] = override_preset["config"]
         applied[phase] = preset_key
 
+    _last_applied = (cache_key, dict(applied))
     return applied
 
 
+def _model_config_matches(applied: Mapping[str, str]) -> bool:
+    """Return True when MODEL_CONFIG still holds the presets from the last apply."""
+    for phase, preset_key in applied.items():
+        preset = agent_settings.MODEL_PRESETS.get(preset_key)
+        if preset is None or agent_settings.MODEL_CONFIG.get(phase) is not preset["config"]:
+            return False
+    return True
+
+
 def _provider_available(provider_slug: str, provider_keys: Mapping[str, str | None]) -> bool:
     # first check persisted keys
     if provider_keys.get(provider_slug):
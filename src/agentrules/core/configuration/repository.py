@@ -13,7 +13,6 @@ try:  # Python 3.11+
     import tomllib as tomli  # type: ignore[import-not-found]
 except ModuleNotFoundError:  # pragma: no cover - fallback for older interpreters
     import tomli  # type: ignore[no-redef]
-import tomli_w
 
 
 class ConfigRepository(Protocol):
@@ -40,6 +39,8 @@ class TomlConfigRepository(ConfigRepository):
         return config_from_dict(payload)
 
     def save(self, config: CLIConfig) -> None:
+        import tomli_w  # Only needed when writing; most commands just load
+
         CONFIG_DIR.mkdir(parents=True, exist_ok=True)
         with self._path.open("wb") as fh:
             tomli_w.dump(config_to_dict(config), fh)
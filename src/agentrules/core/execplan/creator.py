@@ -7,12 +7,20 @@ import re
 import tempfile
 from dataclasses import dataclass
 from datetime import datetime
+from functools import cache
 from importlib import resources
 from pathlib import Path
 from string import Template
 
 import yaml
 
+try:  # Prefer the libyaml-backed C implementations when PyYAML was built with them
+    from yaml import CSafeDumper as _SafeDumper
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - pure-Python PyYAML build
+    from yaml import SafeDumper as _SafeDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
 from agentrules.core.execplan.identity import extract_execplan_id_from_filename, parse_execplan_filename
 from agentrules.core.execplan.locks import execplan_mutation_lock
 from agentrules.core.execplan.milestones import scan_active_milestones_for_archive
@@ -25,6 +33,7 @@ from agentrules.core.execplan.paths import (
     get_execplan_plan_root,
     is_execplan_archive_path,
     is_execplan_milestone_path,
+    iter_markdown_files,
 )
 from agentrules.core.execplan.registry import (
     ALLOWED_DOMAINS,
@@ -110,6 +119,7 @@ def _next_sequence_for_date(execplans_dir: Path, date_yyyymmdd: str) -> int:
     return max_sequence + 1
 
 
+@cache
 def _load_execplan_template() -> Template:
     template_path = resources.files(_TEMPLATE_PACKAGE).joinpath("templates", _TEMPLATE_NAME)
     if not template_path.is_file():
@@ -124,8 +134,8 @@ def _resolve_path(root: Path, value: Path) -> Path:
 def _iter_execplan_files(execplans_dir: Path) -> tuple[Path, ...]:
     return tuple(
         candidate.resolve()
-        for candidate in execplans_dir.rglob("EP-*.md")
-        if candidate.is_file() and not is_execplan_milestone_path(candidate, execplans_root=execplans_dir)
+        for candidate in iter_markdown_files(execplans_dir, prefix="EP-")
+        if not is_execplan_milestone_path(candidate, execplans_root=execplans_dir)
     )
 
 
@@ -153,8 +163,8 @@ def _resolve_execplan_by_id(*, execplans_dir: Path, execplan_id: str) -> Path:
 def _iter_execplan_files_within_plan_root(*, plan_root: Path, execplans_dir: Path) -> tuple[Path, ...]:
     return tuple(
         candidate.resolve()
-        for candidate in plan_root.rglob("EP-*.md")
-        if candidate.is_file() and not is_execplan_milestone_path(candidate, execplans_root=execplans_dir)
+        for candidate in iter_markdown_files(plan_root, prefix="EP-")
+        if not is_execplan_milestone_path(candidate, execplans_root=execplans_dir)
     )
 
 
@@ -168,21 +178,20 @@ def _iter_foreign_milestone_files_within_plan_root(*, plan_root: Path, execplan_
     """
     foreign: list[Path] = []
     resolved_plan_root = plan_root.resolve()
-    for candidate in resolved_plan_root.rglob("*.md"):
-        if not candidate.is_file():
-            continue
-        candidate_id = _extract_milestone_execplan_id(candidate.resolve())
+    for candidate in iter_markdown_files(resolved_plan_root):
+        resolved_candidate = candidate.resolve()
+        candidate_id = _extract_milestone_execplan_id(resolved_candidate)
         if candidate_id is None or candidate_id == execplan_id:
             continue
-        relative_parts = candidate.resolve().relative_to(resolved_plan_root).parts
+        relative_parts = resolved_candidate.relative_to(resolved_plan_root).parts
         if len(relative_parts) >= 3 and relative_parts[0] == MILESTONES_DIR and relative_parts[1] in {
             ACTIVE_DIR,
             ARCHIVE_DIR,
         }:
-            foreign.append(candidate.resolve())
+            foreign.append(resolved_candidate)
             continue
         if len(relative_parts) >= 2 and relative_parts[0] in {ACTIVE_DIR, ARCHIVE_DIR}:
-            foreign.append(candidate.resolve())
+            foreign.append(resolved_candidate)
             continue
     return tuple(sorted(foreign))
 
@@ -198,8 +207,12 @@ def _extract_milestone_execplan_id(path: Path) -> str | None:
     match = FRONT_MATTER_RE.search(content)
     if match is None:
         return None
+    front_matter = match.group(1)
+    # Without the key text (or an escape that could spell it), YAML cannot yield an execplan_id.
+    if "execplan_id" not in front_matter and "\\" not in front_matter:
+        return None
     try:
-        metadata = yaml.safe_load(match.group(1))
+        metadata = yaml.load(front_matter, Loader=_SafeLoader)
     except yaml.YAMLError:
         return None
     if not isinstance(metadata, dict):
@@ -216,18 +229,17 @@ def _iter_unexpected_entries_in_legacy_milestones_root(*, milestones_root: Path,
     """
     unexpected: list[Path] = []
     resolved_root = milestones_root.resolve()
-    for candidate in resolved_root.rglob("*.md"):
-        if not candidate.is_file():
-            continue
-        candidate_id = _extract_milestone_execplan_id(candidate.resolve())
-        relative_parts = candidate.resolve().relative_to(resolved_root).parts
+    for candidate in iter_markdown_files(resolved_root):
+        resolved_candidate = candidate.resolve()
+        candidate_id = _extract_milestone_execplan_id(resolved_candidate)
+        relative_parts = resolved_candidate.relative_to(resolved_root).parts
         allowed = (
             len(relative_parts) >= 2
             and relative_parts[0] in {ACTIVE_DIR, ARCHIVE_DIR}
             and candidate_id == execplan_id
         )
         if not allowed:
-            unexpected.append(candidate.resolve())
+            unexpected.append(resolved_candidate)
     return tuple(sorted(unexpected))
 
 
@@ -255,13 +267,13 @@ def _mark_execplan_archived(*, plan_path: Path, updated_yyyy_mm_dd: str) -> None
     if match is None:
         raise ValueError(f"ExecPlan {plan_path.as_posix()} is missing YAML front matter.")
 
-    metadata = yaml.safe_load(match.group(1))
+    metadata = yaml.load(match.group(1), Loader=_SafeLoader)
     if not isinstance(metadata, dict):
         raise ValueError(f"ExecPlan {plan_path.as_posix()} has invalid YAML front matter.")
 
     metadata["status"] = "archived"
     metadata["updated"] = updated_yyyy_mm_dd
-    updated_front_matter = yaml.safe_dump(metadata, sort_keys=False).strip()
+    updated_front_matter = yaml.dump(metadata, Dumper=_SafeDumper, sort_keys=False).strip()
     updated_content = f"{content[:match.start(1)]}{updated_front_matter}{content[match.end(1):]}"
     _atomic_write_text(plan_path, updated_content)
 
@@ -6,6 +6,7 @@ import os
 import re
 from dataclasses import dataclass
 from datetime import datetime
+from functools import cache
 from importlib import resources
 from pathlib import Path
 from string import Template
@@ -22,6 +23,7 @@ from agentrules.core.execplan.paths import (
     get_execplan_plan_root,
     is_execplan_archive_path,
     is_execplan_milestone_path,
+    iter_markdown_files,
 )
 from agentrules.core.execplan.registry import ALLOWED_DOMAINS, DEFAULT_EXECPLANS_DIR
 
@@ -151,16 +153,13 @@ def _is_milestone_owned_by_execplan(path: Path, *, execplan_id: str) -> bool:
     return _extract_milestone_execplan_id(path) == execplan_id
 
 
-def scan_plan_milestone_files(*, plan_root: Path) -> tuple[MilestoneFileScan, ...]:
+def scan_plan_milestone_files(*, plan_root: Path, include_archived: bool = True) -> tuple[MilestoneFileScan, ...]:
     milestones_root = (plan_root / MILESTONES_DIR).resolve()
     if not milestones_root.exists():
         return ()
 
     scanned: list[MilestoneFileScan] = []
-    for candidate in milestones_root.rglob("*.md"):
-        if not candidate.is_file():
-            continue
-
+    for candidate in iter_markdown_files(milestones_root):
         parsed = parse_milestone_filename(candidate.name)
         if parsed is None:
             continue
@@ -173,8 +172,10 @@ def scan_plan_milestone_files(*, plan_root: Path) -> tuple[MilestoneFileScan, ..
         location: Literal["active", "archived"]
         if relative.parts[0] == ACTIVE_DIR:
             location = "active"
-        else:
+        elif include_archived:
             location = "archived"
+        else:
+            continue
 
         parsed_execplan_id, sequence, _ = parsed
         parse_error: str | None = None
@@ -199,8 +200,8 @@ def scan_plan_milestone_files(*, plan_root: Path) -> tuple[MilestoneFileScan, ..
 def list_invalid_active_milestone_files(*, plan_root: Path) -> tuple[MilestoneFileScan, ...]:
     return tuple(
         file
-        for file in scan_plan_milestone_files(plan_root=plan_root)
-        if file.location == "active" and file.parse_error is not None
+        for file in scan_plan_milestone_files(plan_root=plan_root, include_archived=False)
+        if file.parse_error is not None
     )
 
 
@@ -283,9 +284,7 @@ def scan_active_milestones_for_archive(*, plan_root: Path, execplan_id: str) ->
     active_milestones_for_execplan: list[ActiveMilestoneArchiveScanEntry] = []
     blocking_entries: list[ActiveMilestoneArchiveScanEntry] = []
 
-    for candidate in active_root.rglob("*.md"):
-        if not candidate.is_file():
-            continue
+    for candidate in iter_markdown_files(active_root):
         scanned = _scan_active_milestone_front_matter(candidate.resolve())
         if scanned.parse_error is not None:
             blocking_entries.append(scanned)
@@ -359,6 +358,7 @@ def _validate_single_line_field(value: str, *, field_name: str) -> str:
     return value
 
 
+@cache
 def _load_milestone_template() -> Template:
     template_path = resources.files(_TEMPLATE_PACKAGE).joinpath("templates", _MILESTONE_FILE_TEMPLATE_NAME)
     if not template_path.is_file():
@@ -398,8 +398,8 @@ def _resolve_parent_execplan(
         raise FileNotFoundError(f"ExecPlans directory not found: {execplans_dir}")
 
     matches: list[Path] = []
-    for candidate in execplans_dir.rglob("EP-*.md"):
-        if not candidate.is_file() or is_execplan_milestone_path(candidate, execplans_root=execplans_dir):
+    for candidate in iter_markdown_files(execplans_dir, prefix="EP-"):
+        if is_execplan_milestone_path(candidate, execplans_root=execplans_dir):
             continue
         filename_id = extract_execplan_id_from_filename(candidate.name)
         if filename_id == execplan_id:
@@ -443,10 +443,10 @@ def _uses_legacy_shared_active_root(*, plan_path: Path, plan_root: Path, execpla
     return plan_root == legacy_active_root and plan_path.parent.resolve() == legacy_active_root
 
 
-def _iter_plan_milestone_files(*, plan_root: Path, execplan_id: str) -> list[Path]:
+def _iter_plan_milestone_files(*, plan_root: Path, execplan_id: str, include_archived: bool = True) -> list[Path]:
     files = [
         scanned.path
-        for scanned in scan_plan_milestone_files(plan_root=plan_root)
+        for scanned in scan_plan_milestone_files(plan_root=plan_root, include_archived=include_archived)
         if scanned.execplan_id == execplan_id
     ]
     files.sort()
@@ -602,7 +602,11 @@ def list_execplan_milestones(
 
     milestones_root = (plan_root / MILESTONES_DIR).resolve()
     refs: list[MilestoneRef] = []
-    for path in _iter_plan_milestone_files(plan_root=plan_root, execplan_id=execplan_id):
+    for path in _iter_plan_milestone_files(
+        plan_root=plan_root,
+        execplan_id=execplan_id,
+        include_archived=include_archived,
+    ):
         parsed = parse_milestone_filename(path.name)
         if parsed is None:
             continue
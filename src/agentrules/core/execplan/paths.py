@@ -1,8 +1,10 @@
-"""Path classification helpers for ExecPlan and milestone artifacts."""
+"""Path classification and discovery helpers for ExecPlan and milestone artifacts."""
 
 from __future__ import annotations
 
+import os
 import re
+from collections.abc import Iterator
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -141,6 +143,28 @@ def is_execplan_milestone_path(path: Path, *, execplans_root: Path) -> bool:
     return False
 
 
+def iter_markdown_files(root: Path, *, prefix: str = "") -> Iterator[Path]:
+    """
+    Yield Markdown files under root whose names start with prefix.
+
+    Equivalent to ``root.rglob(f"{prefix}*.md")`` filtered by ``is_file()``, but
+    walks the tree with ``os.scandir`` so file-type checks reuse directory entry
+    data instead of issuing a ``stat`` per candidate. Symlinked directories are
+    not descended into; unreadable directories are skipped.
+    """
+    pending = [os.fspath(root)]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.name.startswith(prefix) and entry.name.endswith(".md") and entry.is_file():
+                        yield Path(entry.path)
+        except OSError:
+            continue
+
+
 def get_execplan_plan_root(path: Path, *, execplans_root: Path) -> Path:
     """
     Resolve the plan root directory that contains an ExecPlan file and milestone subtree.
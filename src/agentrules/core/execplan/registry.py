@@ -6,6 +6,7 @@ import json
 import os
 import re
 import tempfile
+from collections.abc import Iterator
 from dataclasses import dataclass
 from datetime import UTC, date, datetime
 from pathlib import Path
@@ -21,6 +22,7 @@ from agentrules.core.execplan.paths import (
     get_execplan_plan_root,
     is_execplan_archive_path,
     is_execplan_milestone_path,
+    iter_markdown_files,
 )
 
 FRONT_MATTER_RE = re.compile(r"\A\s*---\s*\n(.*?)\n---\s*(?:\n|$)", re.DOTALL)
@@ -269,8 +271,8 @@ def _to_rel_posix(path: Path, root: Path) -> str:
 def _discover_execplan_files(execplans_dir: Path) -> list[Path]:
     return sorted(
         path
-        for path in execplans_dir.rglob("EP-*.md")
-        if path.is_file() and not is_execplan_milestone_path(path, execplans_root=execplans_dir)
+        for path in iter_markdown_files(execplans_dir, prefix="EP-")
+        if not is_execplan_milestone_path(path, execplans_root=execplans_dir)
     )
 
 
@@ -589,9 +591,7 @@ def _count_milestones_for_plan(*, plan_path: Path, execplan_id: str, execplans_d
         if not root.exists():
             continue
         is_active_root = root == active_root
-        for candidate in root.rglob("*.md"):
-            if not candidate.is_file():
-                continue
+        for candidate in iter_markdown_files(root):
             if not _is_owned_milestone_file(candidate.resolve(), execplan_id=execplan_id):
                 continue
             total_count += 1
@@ -600,6 +600,30 @@ def _count_milestones_for_plan(*, plan_path: Path, execplan_id: str, execplans_d
     return active_count, total_count
 
 
+def _iter_active_registry_plans(
+    registry: dict[str, Any],
+    *,
+    root: Path,
+    execplans_dir: Path,
+) -> Iterator[tuple[str, dict[str, Any], str, Path]]:
+    plans = registry.get("plans", [])
+    if not isinstance(plans, list):
+        return
+
+    for plan in plans:
+        if not isinstance(plan, dict):
+            continue
+        plan_id = str(plan.get("id", "")).strip()
+        plan_path_value = str(plan.get("path", "")).strip()
+        if EXECPLAN_ID_RE.fullmatch(plan_id) is None or not plan_path_value:
+            continue
+
+        plan_path = _resolve_registry_plan_path(plan_path_value, root=root)
+        if is_execplan_archive_path(plan_path, execplans_root=execplans_dir):
+            continue
+        yield plan_id, plan, plan_path_value, plan_path
+
+
 def list_active_execplan_summaries(
     *,
     registry: dict[str, Any],
@@ -615,23 +639,12 @@ def list_active_execplan_summaries(
     resolved_root = root.resolve()
     resolved_execplans_dir = _resolve_path(resolved_root, execplans_dir)
 
-    plans = registry.get("plans", [])
-    if not isinstance(plans, list):
-        return ()
-
     summaries: list[ActiveExecPlanSummary] = []
-    for plan in plans:
-        if not isinstance(plan, dict):
-            continue
-        plan_id = str(plan.get("id", "")).strip()
-        plan_path_value = str(plan.get("path", "")).strip()
-        if EXECPLAN_ID_RE.fullmatch(plan_id) is None or not plan_path_value:
-            continue
-
-        plan_path = _resolve_registry_plan_path(plan_path_value, root=resolved_root)
-        if is_execplan_archive_path(plan_path, execplans_root=resolved_execplans_dir):
-            continue
-
+    for plan_id, plan, plan_path_value, plan_path in _iter_active_registry_plans(
+        registry,
+        root=resolved_root,
+        execplans_dir=resolved_execplans_dir,
+    ):
         active_milestones, total_milestones = _count_milestones_for_plan(
             plan_path=plan_path,
             execplan_id=plan_id,
@@ -652,6 +665,30 @@ def list_active_execplan_summaries(
     return tuple(summaries)
 
 
+def count_active_execplans(
+    *,
+    registry: dict[str, Any],
+    root: Path,
+    execplans_dir: Path = DEFAULT_EXECPLANS_DIR,
+) -> int:
+    """
+    Return the number of active ExecPlans in a registry.
+
+    Uses the same notion of "active" as list_active_execplan_summaries but skips
+    the milestone scan, so no plan directories are walked.
+    """
+    resolved_root = root.resolve()
+    resolved_execplans_dir = _resolve_path(resolved_root, execplans_dir)
+    return sum(
+        1
+        for _ in _iter_active_registry_plans(
+            registry,
+            root=resolved_root,
+            execplans_dir=resolved_execplans_dir,
+        )
+    )
+
+
 def summarize_registry_activity(
     *,
     registry: dict[str, Any],
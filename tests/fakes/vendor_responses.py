@@ -84,6 +84,26 @@ class AnthropicMessageCreateResponseFake:
         self.content = blocks
 
 
+class AnthropicMessageStreamFake:
+    """Mimics the context manager returned by ``client.messages.stream``."""
+
+    def __init__(self, final_message: Any, events: list[Any] | None = None) -> None:
+        self._final_message = final_message
+        self._events = events or []
+
+    def __enter__(self) -> "AnthropicMessageStreamFake":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:  # type: ignore[no-untyped-def]
+        return None
+
+    def __iter__(self):  # type: ignore[no-untyped-def]
+        return iter(self._events)
+
+    def get_final_message(self) -> Any:
+        return self._final_message
+
+
 # ------
 # Gemini
 # ------
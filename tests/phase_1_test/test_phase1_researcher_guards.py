@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import unittest
 from collections.abc import Sequence
@@ -124,6 +125,30 @@ class Phase1ResearcherGuardrailsTests(unittest.IsolatedAsyncioTestCase):
         self.assertTrue(executed_tools)
         self.assertTrue(all("error" in record for record in executed_tools))
 
+    async def test_tool_calls_in_one_turn_run_concurrently(self) -> None:
+        started: list[str] = []
+        both_started = asyncio.Event()
+
+        async def tavily(query: str, depth: str, max_results: int) -> str:  # pragma: no cover - injected
+            started.append(query)
+            if len(started) == 2:
+                both_started.set()
+            await asyncio.wait_for(both_started.wait(), timeout=1)
+            return json.dumps({"results": [query]})
+
+        calls = [
+            {"function": {"name": "tavily_web_search", "arguments": json.dumps({"query": query})}}
+            for query in ("flask", "django")
+        ]
+        with patch("agentrules.core.analysis.phase_1.get_architect_for_phase", side_effect=_stub_architect_factory), \
+                patch("agentrules.core.analysis.phase_1.get_researcher_architect", return_value=_NoToolResearcher()), \
+                patch("agentrules.core.analysis.phase_1._run_tavily_search", side_effect=tavily):
+            analyzer = Phase1Analysis(researcher_enabled=True)
+            results = await analyzer._handle_anthropic_tool_calls(calls)
+
+        self.assertEqual([record["args"]["query"] for record in results], ["flask", "django"])
+        self.assertTrue(all(record.get("success") for record in results))
+
 
 if __name__ == "__main__":  # pragma: no cover
     unittest.main()
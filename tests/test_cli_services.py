@@ -1,3 +1,4 @@
+import asyncio
 import io
 import unittest
 from pathlib import Path
@@ -9,8 +10,8 @@ from agentrules.cli.context import CliContext, format_secret_status, mask_secret
 from agentrules.cli.services import pipeline_runner
 
 
-def _close_and_return(coro, result):
-    coro.close()
+def _close_and_return(coro_factory, result):
+    coro_factory().close()
     return result
 
 
@@ -30,7 +31,7 @@ class SecretStatusTests(unittest.TestCase):
 
 class PipelineRunnerTests(unittest.TestCase):
     @patch("agentrules.cli.services.pipeline_runner.PipelineOutputWriter")
-    @patch("agentrules.cli.services.pipeline_runner.asyncio.run")
+    @patch("agentrules.cli.services.pipeline_runner._run_until_complete")
     @patch("agentrules.cli.services.pipeline_runner.build_project_snapshot")
     @patch("agentrules.cli.services.pipeline_runner.create_default_pipeline")
     @patch("agentrules.cli.services.pipeline_runner.get_config_manager")
@@ -39,7 +40,7 @@ class PipelineRunnerTests(unittest.TestCase):
         mock_get_config_manager,
         mock_create_pipeline,
         mock_build_snapshot,
-        mock_asyncio_run,
+        mock_run_until_complete,
         mock_output_writer_cls,
     ) -> None:
         buffer = io.StringIO()
@@ -66,7 +67,7 @@ class PipelineRunnerTests(unittest.TestCase):
         mock_create_pipeline.return_value = mock_pipeline
 
         mock_result = MagicMock()
-        mock_asyncio_run.side_effect = lambda coro: _close_and_return(coro, mock_result)
+        mock_run_until_complete.side_effect = lambda coro_factory: _close_and_return(coro_factory, mock_result)
 
         mock_summary = MagicMock(messages=["summary message"])
         mock_writer_instance = mock_output_writer_cls.return_value
@@ -75,7 +76,7 @@ class PipelineRunnerTests(unittest.TestCase):
         pipeline_runner.run_pipeline(target, offline=False, context=context)
 
         mock_create_pipeline.assert_called_once()
-        mock_asyncio_run.assert_called_once()
+        mock_run_until_complete.assert_called_once()
         mock_config.resolve_rules_filename.assert_called_once_with(override=None)
         mock_writer_instance.persist.assert_called_once()
         output_options = mock_writer_instance.persist.call_args.args[2]
@@ -85,7 +86,7 @@ class PipelineRunnerTests(unittest.TestCase):
         self.assertIn("Analysis finished for:", output)
 
     @patch("agentrules.cli.services.pipeline_runner.PipelineOutputWriter")
-    @patch("agentrules.cli.services.pipeline_runner.asyncio.run")
+    @patch("agentrules.cli.services.pipeline_runner._run_until_complete")
     @patch("agentrules.cli.services.pipeline_runner.build_project_snapshot")
     @patch("agentrules.cli.services.pipeline_runner.create_default_pipeline")
     @patch("agentrules.cli.services.pipeline_runner.get_config_manager")
@@ -94,7 +95,7 @@ class PipelineRunnerTests(unittest.TestCase):
         mock_get_config_manager,
         mock_create_pipeline,
         mock_build_snapshot,
-        mock_asyncio_run,
+        mock_run_until_complete,
         mock_output_writer_cls,
     ) -> None:
         buffer = io.StringIO()
@@ -117,7 +118,7 @@ class PipelineRunnerTests(unittest.TestCase):
         mock_build_snapshot.return_value = MagicMock()
         mock_create_pipeline.return_value = MagicMock()
         mock_result = MagicMock()
-        mock_asyncio_run.side_effect = lambda coro: _close_and_return(coro, mock_result)
+        mock_run_until_complete.side_effect = lambda coro_factory: _close_and_return(coro_factory, mock_result)
 
         mock_writer_instance = mock_output_writer_cls.return_value
         mock_writer_instance.persist.return_value = MagicMock(messages=[])
@@ -127,5 +128,55 @@ class PipelineRunnerTests(unittest.TestCase):
         mock_config.resolve_rules_filename.assert_called_once_with(override="CLAUDE.md")
 
 
+class EventLoopFactoryTests(unittest.TestCase):
+    def test_returns_none_without_uvloop(self) -> None:
+        with patch.object(pipeline_runner, "uvloop", None):
+            self.assertIsNone(pipeline_runner._event_loop_factory())
+
+    def test_returns_none_on_windows(self) -> None:
+        fake_uvloop = MagicMock()
+        with (
+            patch.object(pipeline_runner, "uvloop", fake_uvloop),
+            patch.object(pipeline_runner.sys, "platform", "win32"),
+        ):
+            self.assertIsNone(pipeline_runner._event_loop_factory())
+
+    def test_returns_uvloop_factory_when_available(self) -> None:
+        fake_uvloop = MagicMock()
+        with (
+            patch.object(pipeline_runner, "uvloop", fake_uvloop),
+            patch.object(pipeline_runner.sys, "platform", "linux"),
+        ):
+            self.assertIs(pipeline_runner._event_loop_factory(), fake_uvloop.new_event_loop)
+
+
+class RunUntilCompleteTests(unittest.TestCase):
+    def test_runs_coroutine_without_running_loop(self) -> None:
+        async def _work() -> str:
+            return "done"
+
+        self.assertEqual(pipeline_runner._run_until_complete(_work), "done")
+
+    def test_runs_coroutine_from_inside_running_loop(self) -> None:
+        async def _work() -> str:
+            return "nested"
+
+        async def _caller() -> str:
+            return pipeline_runner._run_until_complete(_work)
+
+        self.assertEqual(asyncio.run(_caller()), "nested")
+
+    def test_does_not_rerun_pipeline_on_runtime_error(self) -> None:
+        calls: list[int] = []
+
+        async def _work() -> None:
+            calls.append(1)
+            raise RuntimeError("boom")
+
+        with self.assertRaises(RuntimeError):
+            pipeline_runner._run_until_complete(_work)
+        self.assertEqual(calls, [1])
+
+
 if __name__ == "__main__":
     unittest.main()
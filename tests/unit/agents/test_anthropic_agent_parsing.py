@@ -1,8 +1,13 @@
+import json
 import unittest
 
 from agentrules.core.agents.anthropic import AnthropicArchitect
 from agentrules.core.agents.anthropic import client as anthropic_client
-from tests.fakes.vendor_responses import AnthropicMessageCreateResponseFake, _AnthropicToolUseBlock
+from tests.fakes.vendor_responses import (
+    AnthropicMessageCreateResponseFake,
+    AnthropicMessageStreamFake,
+    _AnthropicToolUseBlock,
+)
 
 
 class _AnthropicFakeMessagesAPI:
@@ -15,6 +20,9 @@ class _AnthropicFakeMessagesAPI:
         tool_block = _AnthropicToolUseBlock("call_1", "web_search", {"query": "Flask docs"})
         return AnthropicMessageCreateResponseFake(text="analysis", tool_call=tool_block)
 
+    def stream(self, **params):
+        return AnthropicMessageStreamFake(self.create(**params))
+
 
 class _AnthropicFakeClient:
     def __init__(self):
@@ -36,3 +44,25 @@ class AnthropicArchitectParsingTests(unittest.IsolatedAsyncioTestCase):
         self.assertIsNotNone(res.get("tool_calls"))
         tc = res["tool_calls"][0]
         self.assertEqual(tc["name"], "web_search")
+
+
+class AnthropicPromptRenderingTests(unittest.TestCase):
+    def test_prerendered_persona_matches_str_format(self):
+        template = "{agent_name} / {agent_role} {{literal}}\n{agent_responsibilities}\n{context}"
+        arch = AnthropicArchitect(name="Agent", role="role", responsibilities=["a", "b"], prompt_template=template)
+        context = {"text": "{agent_name} {context}"}
+
+        expected = template.format(
+            agent_name="Agent",
+            agent_role="role",
+            agent_responsibilities="- a\n- b",
+            context=json.dumps(context, separators=(",", ":")),
+        )
+        self.assertEqual(arch.format_prompt(context), expected)
+        self.assertEqual(arch.format_prompt(context), expected)
+
+    def test_replacing_template_rerenders_persona(self):
+        arch = AnthropicArchitect(name="Agent", prompt_template="{agent_name}: {context}")
+        arch.format_prompt({})
+        arch.prompt_template = "{agent_role} -> {context}"
+        self.assertEqual(arch.format_prompt({}), "analyzing the project -> {}")
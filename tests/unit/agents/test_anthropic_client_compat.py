@@ -1,11 +1,19 @@
 from __future__ import annotations
 
+import logging
+from types import SimpleNamespace
 from typing import Any
 
 from agentrules.core.agents.anthropic.architect import AnthropicArchitect
-from agentrules.core.agents.anthropic.client import execute_message_request, execute_message_stream, set_client
+from agentrules.core.agents.anthropic.client import (
+    collect_message_stream,
+    execute_message_request,
+    execute_message_stream,
+    set_client,
+)
 from agentrules.core.agents.anthropic.request_builder import PreparedRequest
 from agentrules.core.agents.base import ReasoningMode
+from tests.fakes.vendor_responses import AnthropicMessageStreamFake
 
 
 def test_execute_message_request_moves_output_config_to_extra_body() -> None:
@@ -81,6 +89,35 @@ def test_execute_message_stream_moves_output_config_to_extra_body() -> None:
         set_client(None)
 
 
+def test_collect_message_stream_forwards_text_and_returns_final_message() -> None:
+    final_message = SimpleNamespace(content=[{"type": "text", "text": "hello world"}])
+    events = [
+        SimpleNamespace(type="message_start"),
+        SimpleNamespace(type="content_block_delta", delta=SimpleNamespace(type="text_delta", text="hello ")),
+        SimpleNamespace(type="content_block_delta", delta=SimpleNamespace(type="thinking_delta", thinking="hmm")),
+        SimpleNamespace(type="content_block_delta", delta=SimpleNamespace(type="text_delta", text="world")),
+        SimpleNamespace(type="message_stop"),
+    ]
+
+    class FakeMessages:
+        def stream(self, **kwargs):  # type: ignore[no-untyped-def]
+            return AnthropicMessageStreamFake(final_message, events)
+
+    class FakeClient:
+        messages = FakeMessages()
+
+    set_client(FakeClient())
+    try:
+        received: list[str] = []
+        payload = {"model": "claude-sonnet-4-5", "max_tokens": 1, "messages": []}
+        result = collect_message_stream(payload, on_text_delta=received.append)
+
+        assert result is final_message
+        assert received == ["hello ", "world"]
+    finally:
+        set_client(None)
+
+
 def test_anthropic_architect_stream_does_not_pass_output_config_kwarg() -> None:
     captured: dict[str, Any] = {}
 
@@ -129,3 +166,17 @@ def test_anthropic_architect_stream_does_not_pass_output_config_kwarg() -> None:
         assert "stream" not in kwargs
     finally:
         set_client(None)
+
+
+def test_text_progress_logger_throttles_debug_lines(caplog) -> None:  # type: ignore[no-untyped-def]
+    caplog.set_level(logging.DEBUG, logger="project_extractor")
+    arch = AnthropicArchitect(model_name="claude-sonnet-4-5", model_config=None)
+    on_text_delta = arch._text_progress_logger("Claude")
+    assert on_text_delta is not None
+
+    for _ in range(10_000):
+        on_text_delta("x")
+
+    messages = [record.getMessage() for record in caplog.records]
+    assert messages[0] == "Claude: first text received from claude-sonnet-4-5"
+    assert len(messages) == 3  # first text, then at 4k and 8k characters
@@ -1,13 +1,19 @@
 from __future__ import annotations
 
+import json
+import os
+import tempfile
 import unittest
+from pathlib import Path
 from typing import Any, cast
+from unittest.mock import patch
 
 from google.genai import types as genai_types
 from google.protobuf.struct_pb2 import Struct
 
 from agentrules.core.agents.base import ReasoningMode
-from agentrules.core.agents.gemini import GeminiArchitect
+from agentrules.core.agents.cache import RESPONSE_CACHE_ENV_VAR, ResponseCache
+from agentrules.core.agents.gemini import GeminiAgent, GeminiArchitect
 from tests.fakes.vendor_responses import GeminiGenerateContentResponseFake, _FunctionCallFake
 
 
@@ -80,3 +86,102 @@ class GeminiArchitectParsingTests(unittest.IsolatedAsyncioTestCase):
         self.assertIsNotNone(thinking_level)
         self.assertEqual(config.thinking_config.thinking_level, thinking_level.LOW)
         self.assertIsNone(config.thinking_config.thinking_budget)
+
+    async def test_generation_config_is_reused_without_explicit_tools(self):
+        arch = GeminiArchitect(reasoning=ReasoningMode.ENABLED)
+        arch.client = _GeminiFakeClient()  # type: ignore
+        await arch.analyze({"x": 1})
+        first = arch.client.models.last_call["config"]  # type: ignore[index]
+        await arch.analyze({"x": 2})
+        self.assertIs(arch.client.models.last_call["config"], first)  # type: ignore[index]
+
+
+class GeminiResponseCacheTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self._env = patch.dict(os.environ, {RESPONSE_CACHE_ENV_VAR: self._tmp.name})
+        self._env.start()
+
+    async def asyncTearDown(self):
+        self._env.stop()
+        self._tmp.cleanup()
+
+    async def test_identical_request_is_served_from_cache(self):
+        arch = GeminiArchitect(name="Cached", role="caching")
+        arch.client = _GeminiFakeClient()  # type: ignore
+        first = await arch.analyze({"x": 1})
+
+        arch.client.models.last_call = None  # type: ignore[attr-defined]
+        second = await arch.analyze({"x": 1})
+
+        self.assertIsNone(arch.client.models.last_call)  # type: ignore[attr-defined]
+        self.assertEqual(second, first)
+
+    async def test_changed_prompt_misses_cache(self):
+        arch = GeminiArchitect()
+        arch.client = _GeminiFakeClient()  # type: ignore
+        await arch.analyze({"x": 1})
+
+        arch.client.models.last_call = None  # type: ignore[attr-defined]
+        await arch.analyze({"x": 2})
+
+        self.assertIsNotNone(arch.client.models.last_call)  # type: ignore[attr-defined]
+
+    async def test_invalid_entry_is_evicted(self):
+        cache = ResponseCache(Path(self._tmp.name))
+        key = "ab" + "0" * 62
+        cache.put(key, {"agent": "x"})
+
+        self.assertIsNone(cache.get(key, required_keys=("agent", "findings")))
+        self.assertFalse((Path(self._tmp.name) / "ab" / f"{key}.json").exists())
+
+    async def test_expired_entry_is_evicted(self):
+        key = "cd" + "0" * 62
+        ResponseCache(Path(self._tmp.name)).put(key, {"agent": "x", "findings": "y"})
+
+        self.assertIsNotNone(ResponseCache(Path(self._tmp.name), ttl_seconds=60).get(key))
+        self.assertIsNone(ResponseCache(Path(self._tmp.name), ttl_seconds=-1).get(key))
+
+    async def test_naive_timestamp_is_treated_as_expired(self):
+        key = "ef" + "0" * 62
+        path = Path(self._tmp.name) / "ef" / f"{key}.json"
+        ResponseCache(Path(self._tmp.name)).put(key, {"agent": "x", "findings": "y"})
+        envelope = json.loads(path.read_text(encoding="utf-8"))
+        envelope["created_at"] = "2026-01-01T00:00:00"
+        path.write_text(json.dumps(envelope), encoding="utf-8")
+
+        self.assertIsNone(ResponseCache(Path(self._tmp.name), ttl_seconds=60).get(key))
+        self.assertFalse(path.exists())
+
+
+class GeminiPromptRenderingTests(unittest.TestCase):
+    def test_prerendered_persona_matches_str_format(self):
+        template = "{agent_name} / {agent_role} {{literal}}\n{agent_responsibilities}\n{context}"
+        arch = GeminiArchitect(name="Agent", role="role", responsibilities=["a", "b"], prompt_template=template)
+        context = {"text": "{agent_name} {context}"}
+
+        expected = template.format(
+            agent_name="Agent",
+            agent_role="role",
+            agent_responsibilities="- a\n- b",
+            context=json.dumps(context, indent=2),
+        )
+        self.assertEqual(arch.format_prompt(context), expected)
+        self.assertEqual(arch.format_prompt(context), expected)
+
+    def test_replacing_template_rerenders_persona(self):
+        arch = GeminiArchitect(name="Agent", prompt_template="{agent_name}: {context}")
+        arch.format_prompt({})
+        arch.prompt_template = "{agent_role} -> {context}"
+        self.assertEqual(arch.format_prompt({}), "analyzing the project -> {}")
+
+
+class GeminiAgentProxyTests(unittest.TestCase):
+    def test_legacy_agent_forwards_to_architect(self):
+        agent = GeminiAgent(name="Legacy", role="testing", responsibilities=["one"])
+        self.assertEqual(agent.name, "Legacy")
+        self.assertEqual(agent.responsibilities, ["one"])
+        self.assertIs(agent.prompt_template, agent._architect.prompt_template)
+        self.assertIn("- one", agent.format_prompt({}))
+        with self.assertRaises(AttributeError):
+            agent.missing_attribute  # noqa: B018
@@ -3,6 +3,7 @@ import pytest
 
 from agentrules.core.agents.anthropic import AnthropicArchitect
 from agentrules.core.agents.anthropic import client as anthropic_client
+from tests.fakes.vendor_responses import AnthropicMessageStreamFake
 
 
 class _BlockText:
@@ -34,6 +35,9 @@ class _FakeMessages:
     def create(self, **kwargs):
         return self._resp
 
+    def stream(self, **kwargs):
+        return AnthropicMessageStreamFake(self._resp)
+
 
 class _FakeClient:
     def __init__(self, resp):
@@ -84,3 +88,16 @@ async def test_anthropic_analyze_parses_dict_tool_use(monkeypatch):
         ]
     finally:
         anthropic_client.set_client(None)
+
+
+def test_parse_response_skips_tool_probe_for_text_blocks():
+    from agentrules.core.agents.anthropic.response_parser import parse_response
+
+    class _TypedText:
+        type = "text"
+        text = "plain"
+        tool_use = _ToolUse("ignored", "ignored", {})
+
+    parsed = parse_response(_FakeResponse([_TypedText(), {"type": "thinking", "thinking": "..."}]))
+    assert parsed.findings == "plain"
+    assert parsed.tool_calls is None
@@ -23,3 +23,27 @@ def test_gemini_analyze_client_not_initialized(monkeypatch):
     # analyze should return an error field when client missing
     out = asyncio.run(arch.analyze({}))
     assert "error" in out and "not initialized" in out["error"].lower()
+
+
+def test_gemini_architects_share_client_per_key(monkeypatch):
+    from agentrules.core.agents.gemini.client import reset_gemini_clients
+
+    class FakeClient:
+        def __init__(self, api_key=None, http_options=None):
+            self.api_key = api_key
+            self.http_options = http_options
+
+    monkeypatch.setattr(gemini_mod.genai, "Client", FakeClient)
+    reset_gemini_clients()
+    try:
+        first = GeminiArchitect(api_key="key-a")
+        second = GeminiArchitect(api_key="key-a")
+        other = GeminiArchitect(api_key="key-b")
+    finally:
+        reset_gemini_clients()
+
+    assert first.client is second.client
+    assert other.client is not first.client
+    assert isinstance(first.client, FakeClient)
+    assert first.client.http_options is not None
+    assert first.client.http_options.retry_options.attempts > 1
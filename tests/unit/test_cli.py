@@ -68,6 +68,23 @@ class CLITestCase(unittest.TestCase):
         self.assertIs(call_args[2], context)
         self.assertIsNone(mock_run_pipeline.call_args.kwargs["rules_filename_override"])
 
+    def test_analyze_command_defaults_to_current_directory(self) -> None:
+        from agentrules import cli
+
+        runner = CliRunner()
+
+        with patch("agentrules.cli.commands.analyze.bootstrap_runtime"), patch(
+            "agentrules.cli.commands.analyze.run_pipeline"
+        ) as mock_run_pipeline:
+            result = runner.invoke(
+                cli.app,
+                ["analyze", "--offline"],
+                env={"AGENTRULES_CONFIG_DIR": self.temp_dir.name},
+            )
+
+        self.assertEqual(result.exit_code, 0, msg=result.output)
+        self.assertEqual(mock_run_pipeline.call_args[0][0], Path.cwd())
+
     def test_analyze_command_accepts_rules_filename_override(self) -> None:
         from agentrules import cli
 
@@ -88,6 +105,24 @@ class CLITestCase(unittest.TestCase):
         mock_run_pipeline.assert_called_once()
         self.assertEqual(mock_run_pipeline.call_args.kwargs["rules_filename_override"], "CLAUDE.md")
 
+    def test_analyze_command_accepts_cache_dir(self) -> None:
+        from agentrules import cli
+
+        runner = CliRunner()
+        cache_dir = Path(self.temp_dir.name) / "responses"
+
+        with patch("agentrules.cli.commands.analyze.bootstrap_runtime"), patch(
+            "agentrules.cli.commands.analyze.run_pipeline"
+        ) as mock_run_pipeline:
+            result = runner.invoke(
+                cli.app,
+                ["analyze", str(Path.cwd()), "--cache-dir", str(cache_dir)],
+                env={"AGENTRULES_CONFIG_DIR": self.temp_dir.name},
+            )
+
+        self.assertEqual(result.exit_code, 0, msg=result.output)
+        self.assertEqual(mock_run_pipeline.call_args.kwargs["response_cache_dir"], cache_dir.resolve())
+
     def test_analyze_command_rejects_rules_filename_paths(self) -> None:
         from agentrules import cli
 
@@ -6,7 +6,7 @@ from pathlib import Path
 from unittest import mock
 
 from agentrules.core.execplan import locks as lock_module
-from agentrules.core.execplan.creator import archive_execplan, create_execplan
+from agentrules.core.execplan.creator import _extract_milestone_execplan_id, archive_execplan, create_execplan
 
 
 class ExecPlanCreatorTests(unittest.TestCase):
@@ -1051,6 +1051,25 @@ class ExecPlanCreatorTests(unittest.TestCase):
             self.assertTrue(modern.exists())
             self.assertFalse((execplans_dir / "archive" / "2026" / "02" / "12" / "EP-20260207-001_active").exists())
 
+    def test_extract_milestone_execplan_id_requires_valid_front_matter(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            cases = {
+                "quoted.md": '---\ntitle: Step\nexecplan_id: "EP-20260207-001"\n---\n',
+                "commented.md": "---\nexecplan_id: EP-20260207-002  # owner plan\n---\n",
+                "nested.md": "---\nmeta:\n  execplan_id: EP-20260207-003\n---\n",
+                "body_only.md": "---\ntitle: Step\n---\nexecplan_id: EP-20260207-004\n",
+                "malformed.md": "---\nexecplan_id: EP-20260207-005\ntitle: [unclosed\n---\n",
+            }
+            for name, text in cases.items():
+                (root / name).write_text(text, encoding="utf-8")
+
+            self.assertEqual(_extract_milestone_execplan_id(root / "quoted.md"), "EP-20260207-001")
+            self.assertEqual(_extract_milestone_execplan_id(root / "commented.md"), "EP-20260207-002")
+            self.assertIsNone(_extract_milestone_execplan_id(root / "nested.md"))
+            self.assertIsNone(_extract_milestone_execplan_id(root / "body_only.md"))
+            self.assertIsNone(_extract_milestone_execplan_id(root / "malformed.md"))
+
 
 if __name__ == "__main__":
     unittest.main()
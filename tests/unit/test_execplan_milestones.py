@@ -201,6 +201,25 @@ class ExecPlanMilestonesTests(unittest.TestCase):
             )
             self.assertEqual(next_sequence, 8)
 
+    def test_scan_active_only_skips_archived_milestone_files(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            plan_root = Path(tmpdir) / ".agent" / "exec_plans" / "active" / "scan-guard"
+            active = plan_root / "milestones" / "active" / "MS002_active.md"
+            archived = plan_root / "milestones" / "archive" / "2026" / "02" / "12" / "MS001_archived.md"
+            for path in (active, archived):
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_text("# missing front matter\n", encoding="utf-8")
+
+            with mock.patch.object(
+                milestone_module,
+                "_extract_milestone_execplan_id_with_error",
+                wraps=milestone_module._extract_milestone_execplan_id_with_error,
+            ) as extract:
+                scanned = milestone_module.scan_plan_milestone_files(plan_root=plan_root, include_archived=False)
+
+            self.assertEqual([entry.path for entry in scanned], [active.resolve()])
+            extract.assert_called_once_with(active.resolve())
+
     def test_create_milestone_rejects_duplicate_parent_execplan_ids(self) -> None:
         with tempfile.TemporaryDirectory() as tmpdir:
             root = Path(tmpdir)
@@ -6,6 +6,7 @@ from agentrules.core.execplan.paths import (
     get_execplan_plan_root,
     is_execplan_archive_path,
     is_execplan_milestone_path,
+    iter_markdown_files,
 )
 
 
@@ -87,6 +88,27 @@ class ExecPlanPathsTests(unittest.TestCase):
             self.assertFalse(is_execplan_milestone_path(plan_path, execplans_root=execplans_dir))
             self.assertTrue(is_execplan_archive_path(plan_path, execplans_root=execplans_dir))
 
+    def test_iter_markdown_files_matches_rglob_with_prefix(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            execplans_dir = Path(tmpdir) / ".agent" / "exec_plans"
+            plan_path = execplans_dir / "active" / "demo" / "EP-20260207-001_demo.md"
+            milestone_path = plan_path.parent / "milestones" / "active" / "EP-20260207-001_MS001_step.md"
+            notes_path = plan_path.parent / "notes.md"
+            for path in (plan_path, milestone_path, notes_path):
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_text("# placeholder\n", encoding="utf-8")
+            (execplans_dir / "active" / "EP-20260207-002_dir.md").mkdir()
+
+            self.assertEqual(
+                sorted(iter_markdown_files(execplans_dir, prefix="EP-")),
+                sorted([plan_path, milestone_path]),
+            )
+            self.assertEqual(
+                sorted(iter_markdown_files(execplans_dir)),
+                sorted([plan_path, milestone_path, notes_path]),
+            )
+            self.assertEqual(list(iter_markdown_files(execplans_dir / "missing")), [])
+
 
 if __name__ == "__main__":
     unittest.main()
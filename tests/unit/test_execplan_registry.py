@@ -7,6 +7,7 @@ from pathlib import Path
 from agentrules.core.execplan.registry import (
     build_execplan_registry,
     collect_execplan_registry,
+    count_active_execplans,
     list_active_execplan_summaries,
     summarize_registry_activity,
 )
@@ -294,6 +295,14 @@ class ExecPlanRegistryTests(unittest.TestCase):
             self.assertEqual(summary.active_execplans, 1)
             self.assertEqual(summary.active_milestones, 1)
             self.assertEqual(summary.total_milestones, 2)
+            self.assertEqual(
+                count_active_execplans(
+                    registry=collected.registry,
+                    root=root,
+                    execplans_dir=execplans_dir,
+                ),
+                summary.active_execplans,
+            )
 
     def test_build_writes_sorted_registry_and_excludes_milestones(self) -> None:
         with tempfile.TemporaryDirectory() as tmpdir:
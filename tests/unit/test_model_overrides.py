@@ -55,3 +55,12 @@ class ModelOverrideTestCase(unittest.TestCase):
         self.config_manager.set_phase_model("phase1", None)
         self.model_config.apply_user_overrides()
         self.assertEqual(self.agents_module.MODEL_CONFIG["phase1"], default_config)
+
+    def test_apply_user_overrides_reapplies_after_external_mutation(self) -> None:
+        applied = self.model_config.apply_user_overrides({"phase2": "claude-sonnet-reasoning"})
+        expected = self.agents_module.MODEL_PRESETS["claude-sonnet-reasoning"]["config"]
+        self.assertEqual(self.model_config.apply_user_overrides({"phase2": "claude-sonnet-reasoning"}), applied)
+
+        self.agents_module.MODEL_CONFIG["phase2"] = None  # type: ignore[assignment]
+        self.model_config.apply_user_overrides({"phase2": "claude-sonnet-reasoning"})
+        self.assertIs(self.agents_module.MODEL_CONFIG["phase2"], expected)
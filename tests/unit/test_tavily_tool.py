@@ -1,3 +1,4 @@
+import asyncio
 import json
 
 import pytest
@@ -33,6 +34,8 @@ async def test_run_tavily_search_clamps_max_results_and_calls_client(monkeypatch
 
     monkeypatch.setenv("TAVILY_API_KEY", "dummy")
     monkeypatch.setattr(tavily_mod, "AsyncTavilyClient", FakeClient)
+    monkeypatch.setattr(tavily_mod, "_SEARCH_CACHE", {})
+    monkeypatch.setattr(tavily_mod, "_SHARED_CLIENT", None)
 
     res = await tavily_mod.run_tavily_search("docs", search_depth="advanced", max_results=100)
     data = json.loads(res)
@@ -43,3 +46,97 @@ async def test_run_tavily_search_clamps_max_results_and_calls_client(monkeypatch
     # clamped to 10
     assert calls["args"]["max_results"] == 10
 
+
+def test_normalize_search_depth_is_case_insensitive_and_defaults_to_basic():
+    assert tavily_mod._normalize_search_depth("advanced") == "advanced"
+    assert tavily_mod._normalize_search_depth("ADVANCED") == "advanced"
+    assert tavily_mod._normalize_search_depth("basic") == "basic"
+    assert tavily_mod._normalize_search_depth(None) == "basic"
+
+
+@pytest.mark.asyncio
+async def test_run_tavily_search_reuses_cached_results(monkeypatch):
+    searches = []
+
+    class FakeClient:
+        def __init__(self, api_key: str):
+            pass
+
+        async def search(self, query: str, search_depth: str, max_results: int):
+            searches.append(query)
+            return {"results": [query]}
+
+    monkeypatch.setenv("TAVILY_API_KEY", "dummy")
+    monkeypatch.setattr(tavily_mod, "AsyncTavilyClient", FakeClient)
+    monkeypatch.setattr(tavily_mod, "_SEARCH_CACHE", {})
+    monkeypatch.setattr(tavily_mod, "_SHARED_CLIENT", None)
+
+    first = await tavily_mod.run_tavily_search("docs")
+    second = await tavily_mod.run_tavily_search("docs")
+    assert first == second
+    assert searches == ["docs"]
+
+    await tavily_mod.run_tavily_search("docs", no_cache=True)
+    await tavily_mod.run_tavily_search("docs", search_depth="advanced")
+    assert searches == ["docs", "docs", "docs"]
+
+
+@pytest.mark.asyncio
+async def test_run_tavily_search_coalesces_concurrent_duplicates(monkeypatch):
+    searches = []
+    release = asyncio.Event()
+
+    class FakeClient:
+        def __init__(self, api_key: str):
+            pass
+
+        async def search(self, query: str, search_depth: str, max_results: int):
+            searches.append(query)
+            await release.wait()
+            return {"results": [query]}
+
+    monkeypatch.setenv("TAVILY_API_KEY", "dummy")
+    monkeypatch.setattr(tavily_mod, "AsyncTavilyClient", FakeClient)
+    monkeypatch.setattr(tavily_mod, "_SEARCH_CACHE", {})
+    monkeypatch.setattr(tavily_mod, "_SHARED_CLIENT", None)
+    monkeypatch.setattr(tavily_mod, "_INFLIGHT_SEARCHES", {})
+
+    pending = [asyncio.create_task(tavily_mod.run_tavily_search("docs")) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*pending)
+
+    assert searches == ["docs"]
+    assert len(set(results)) == 1
+    assert tavily_mod._INFLIGHT_SEARCHES == {}
+
+
+@pytest.mark.asyncio
+async def test_run_tavily_search_reuses_one_client_until_closed(monkeypatch):
+    clients = []
+
+    class FakeClient:
+        def __init__(self, api_key: str):
+            self.closed = False
+            clients.append(self)
+
+        async def search(self, query: str, search_depth: str, max_results: int):
+            return {"results": [query]}
+
+        async def close(self):
+            self.closed = True
+
+    monkeypatch.setenv("TAVILY_API_KEY", "dummy")
+    monkeypatch.setattr(tavily_mod, "AsyncTavilyClient", FakeClient)
+    monkeypatch.setattr(tavily_mod, "_SEARCH_CACHE", {})
+    monkeypatch.setattr(tavily_mod, "_SHARED_CLIENT", None)
+
+    await tavily_mod.run_tavily_search("first")
+    await tavily_mod.run_tavily_search("second")
+    assert len(clients) == 1
+
+    await tavily_mod.close_tavily_client()
+    assert clients[0].closed
+    await tavily_mod.run_tavily_search("third")
+    assert len(clients) == 2
+    await tavily_mod.close_tavily_client()
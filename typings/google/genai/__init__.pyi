@@ -4,7 +4,7 @@ from . import types as types
 
 class Client:
     models: Any
-    def __init__(self, api_key: str | None = ...) -> None: ...
+    def __init__(self, api_key: str | None = ..., http_options: types.HttpOptions | None = ...) -> None: ...
 
 class GenerativeModel: ...
 class GenerationConfig: ...
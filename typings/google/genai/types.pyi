@@ -4,7 +4,24 @@ class ThinkingConfig:
     thinking_budget: int | None
     def __init__(self, *, thinking_budget: int | None = ...) -> None: ...
 
+class HttpRetryOptions:
+    attempts: int | None
+    initial_delay: float | None
+    max_delay: float | None
+    def __init__(
+        self,
+        *,
+        attempts: int | None = ...,
+        initial_delay: float | None = ...,
+        max_delay: float | None = ...,
+        **kwargs: Any,
+    ) -> None: ...
+
+class HttpOptions:
+    retry_options: HttpRetryOptions | None
+    def __init__(self, *, retry_options: HttpRetryOptions | None = ..., **kwargs: Any) -> None: ...
+
 class GenerateContentConfig:
     def __init__(self, **kwargs: Any) -> None: ...
 
-__all__ = ["ThinkingConfig", "GenerateContentConfig"]
+__all__ = ["ThinkingConfig", "HttpRetryOptions", "HttpOptions", "GenerateContentConfig"]